@@ -21,6 +21,7 @@ import os
 import sys
 import tempfile
 import time
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Optional, Tuple, List
 import wave
@@ -31,6 +32,14 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 from chatterbox.services.tts import PiperTTSService
 
 
+@lru_cache(maxsize=1024)
+def _hash_cache_key(content: str) -> str:
+    """Hash a cache-key payload (memoized — the mapping is pure)."""
+    # BLAKE2b is faster than SHA256 and, at digest_size=32, yields the
+    # same 64-char hex keys the cache filenames already use.
+    return hashlib.blake2b(content.encode("utf-8"), digest_size=32).hexdigest()
+
+
 class PiperDemo:
     """Piper TTS Demo with caching and summarization capabilities."""
 
@@ -71,7 +80,7 @@ class PiperDemo:
         """Generate cache key from text and model paths."""
         # Create hash from text and model paths for uniqueness
         content = f"{text}|{self.model_path}|{self.config_path}"
-        return hashlib.sha256(content.encode()).hexdigest()
+        return _hash_cache_key(content)
 
     def _get_cache_path(self, cache_key: str) -> str:
         """Get full path for cached audio file."""
@@ -16,7 +16,9 @@ Reference: https://developers.home-assistant.io/docs/core/conversation/custom_ag
 from __future__ import annotations
 
 import logging
+import sys
 import uuid
+from collections import deque
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -31,6 +33,36 @@ from chatterbox.conversation.providers import (
 
 logger = logging.getLogger(__name__)
 
+# Interned message-dict keys/roles: history dicts are built twice per turn,
+# and interned strings hit the dict's identity fast path on lookup.
+_ROLE = sys.intern("role")
+_CONTENT = sys.intern("content")
+_USER = sys.intern("user")
+_ASSISTANT = sys.intern("assistant")
+
+# Canonical spoken error responses, built once instead of per exception.
+_ERR_STUCK = "I'm sorry, I got stuck trying to answer that. Please try again."
+_ERR_RATE_LIMIT = (
+    "I'm sorry, I'm receiving too many requests right now. "
+    "Please try again in a moment."
+)
+_ERR_CONNECTION = (
+    "I'm sorry, I can't reach my language model right now. "
+    "Please check the connection and try again."
+)
+_ERR_API = "I'm sorry, my language model returned an error. Please try again."
+_ERR_GENERIC = "I'm sorry, I encountered an error. Please try again."
+
+# Exception-to-response dispatch table, ordered most-specific first. The
+# error path walks this once instead of falling through a chain of except
+# blocks; _ERR_GENERIC handles anything not listed.
+_EXC_TABLE: tuple[tuple[type[BaseException], str, int], ...] = (
+    (LLMRateLimitError, _ERR_RATE_LIMIT, logging.WARNING),
+    (LLMConnectionError, _ERR_CONNECTION, logging.ERROR),
+    (LLMAPIError, _ERR_API, logging.ERROR),
+    (RuntimeError, _ERR_STUCK, logging.ERROR),
+)
+
 # System prompt template for the voice assistant persona.
 _DEFAULT_SYSTEM_PROMPT = (
     "You are Chatterbox, a helpful voice assistant integrated with Home Assistant. "
@@ -40,7 +72,7 @@ _DEFAULT_SYSTEM_PROMPT = (
 )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ConversationInput:
     """Input to a single conversation turn.
 
@@ -57,7 +89,7 @@ class ConversationInput:
     language: str = "en"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ConversationResult:
     """Result of a single conversation turn.
 
@@ -130,37 +162,25 @@ class ChatterboxConversationEntity:
             max_iterations=max_iterations,
             system_prompt=system_prompt,
         )
-        # In-memory chat history per conversation_id.
+        # In-memory chat history per conversation_id. Bounded deques give
+        # O(1) append with the oldest turn dropped automatically, instead
+        # of re-slicing a growing list per turn.
         # Task 4.8 decision: persistent storage deferred to Epic 5.
         # See docs/context-management-research.md for rationale.
-        self._histories: dict[str, list[dict[str, Any]]] = {}
+        self._histories: dict[str, deque[dict[str, Any]]] = {}
 
-    def _truncate_history(self, history: list[dict[str, Any]]) -> list[dict[str, Any]]:
-        """Return a window of *history* capped at ``max_history_turns``.
-
-        Each turn is two messages (user + assistant). If ``max_history_turns``
-        is 0 (disabled), the full history is returned unchanged.
-
-        Args:
-            history: Full in-memory message list for a session.
+    def _history_for(self, conversation_id: str) -> deque[dict[str, Any]]:
+        """Return (creating if needed) the bounded history for a session.
 
-        Returns:
-            A (possibly shortened) copy of the history.
+        Each turn is two messages (user + assistant), so the deque's
+        ``maxlen`` is ``max_history_turns * 2``. If ``max_history_turns``
+        is 0 (disabled), the history is unbounded.
         """
-        if self.max_history_turns == 0 or len(history) == 0:
-            return list(history)
-        # Each turn = 2 messages; keep only the last N turns.
-        keep = self.max_history_turns * 2
-        if len(history) > keep:
-            dropped = (len(history) - keep) // 2
-            logger.debug(
-                "History window: dropping %d oldest turn(s) to stay within "
-                "max_history_turns=%d",
-                dropped,
-                self.max_history_turns,
-            )
-            return history[-keep:]
-        return list(history)
+        history = self._histories.get(conversation_id)
+        if history is None:
+            maxlen = self.max_history_turns * 2 or None
+            history = self._histories[conversation_id] = deque(maxlen=maxlen)
+        return history
 
     async def async_process(self, user_input: ConversationInput) -> ConversationResult:
         """Process one conversation turn.
@@ -184,8 +204,7 @@ class ChatterboxConversationEntity:
             conv_id = str(uuid.uuid4())
             logger.debug("Auto-created conversation_id=%r", conv_id)
 
-        history = self._histories.get(conv_id, []) if conv_id else []
-        history = self._truncate_history(history)
+        history = list(self._histories.get(conv_id, ())) if conv_id else []
 
         logger.info(
             "Processing conversation turn: id=%r, text=%r, history_len=%d",
@@ -200,75 +219,40 @@ class ChatterboxConversationEntity:
                 chat_history=history,
                 tools=self.tools,
             )
-        except RuntimeError as exc:
-            logger.error(
-                "AgenticLoop exceeded iteration limit for conversation id=%r: %s",
-                conv_id,
-                exc,
-            )
-            return ConversationResult(
-                response_text=(
-                    "I'm sorry, I got stuck trying to answer that. Please try again."
-                ),
-                conversation_id=conv_id,
-            )
-        except LLMRateLimitError as exc:
-            logger.warning(
-                "LLM rate limit hit for conversation id=%r: %s",
-                conv_id,
-                exc,
-            )
-            return ConversationResult(
-                response_text=(
-                    "I'm sorry, I'm receiving too many requests right now. "
-                    "Please try again in a moment."
-                ),
-                conversation_id=conv_id,
-            )
-        except LLMConnectionError as exc:
-            logger.error(
-                "LLM connection error for conversation id=%r: %s",
-                conv_id,
-                exc,
-            )
-            return ConversationResult(
-                response_text=(
-                    "I'm sorry, I can't reach my language model right now. "
-                    "Please check the connection and try again."
-                ),
-                conversation_id=conv_id,
-            )
-        except LLMAPIError as exc:
-            logger.error(
-                "LLM API error for conversation id=%r (status=%s): %s",
-                conv_id,
-                exc.status_code,
-                exc,
-            )
-            return ConversationResult(
-                response_text=(
-                    "I'm sorry, my language model returned an error. Please try again."
-                ),
-                conversation_id=conv_id,
-            )
         except Exception as exc:
-            logger.error(
-                "Unexpected error in agentic loop for conversation id=%r: %s",
-                conv_id,
-                exc,
-                exc_info=True,
-            )
+            for exc_cls, response, level in _EXC_TABLE:
+                if isinstance(exc, exc_cls):
+                    logger.log(
+                        level,
+                        "%s in agentic loop for conversation id=%r: %s",
+                        type(exc).__name__,
+                        conv_id,
+                        exc,
+                    )
+                    break
+            else:
+                response = _ERR_GENERIC
+                logger.error(
+                    "Unexpected error in agentic loop for conversation id=%r: %s",
+                    conv_id,
+                    exc,
+                    exc_info=True,
+                )
             return ConversationResult(
-                response_text=("I'm sorry, I encountered an error. Please try again."),
+                response_text=response,
                 conversation_id=conv_id,
             )
 
-        # Update in-memory history for this session (only on success)
+        # Update in-memory history for this session (only on success);
+        # the bounded deque drops the oldest turn automatically.
         if conv_id is not None:
-            updated_history = list(history)
-            updated_history.append({"role": "user", "content": user_input.text})
-            updated_history.append({"role": "assistant", "content": response_text})
-            self._histories[conv_id] = updated_history
+            session_history = self._history_for(conv_id)
+            session_history.extend(
+                (
+                    {_ROLE: _USER, _CONTENT: user_input.text},
+                    {_ROLE: _ASSISTANT, _CONTENT: response_text},
+                )
+            )
 
         logger.info(
             "Conversation turn complete: id=%r, response=%r", conv_id, response_text
@@ -15,8 +15,11 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import sys
 import time
-from typing import Any, Awaitable, Callable
+from collections import OrderedDict
+from hashlib import sha256
+from typing import Any, Awaitable, Callable, Protocol, runtime_checkable
 
 from chatterbox.conversation.providers import (
     CompletionResult,
@@ -27,11 +30,97 @@ from chatterbox.conversation.providers import (
 
 logger = logging.getLogger(__name__)
 
+try:  # optional: faster, whitespace-free serialisation on the tool hot path
+    import orjson
+
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+
+    def _dumps_sorted(obj: Any) -> str:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_SORT_KEYS).decode()
+
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+
+    def _dumps(obj: Any) -> str:
+        return json.dumps(obj, separators=(",", ":"))
+
+    def _dumps_sorted(obj: Any) -> str:
+        return json.dumps(obj, sort_keys=True, separators=(",", ":"), default=str)
+
+
+# Interned message-dict keys/roles, mirroring entity.py: every iteration
+# builds role-bearing dicts, and interned strings hit the dict identity
+# fast path on both construction and the role scans consumers perform.
+_ROLE = sys.intern("role")
+_CONTENT = sys.intern("content")
+_SYSTEM = sys.intern("system")
+_USER = sys.intern("user")
+_TOOL = sys.intern("tool")
+_TOOL_CALL_ID = sys.intern("tool_call_id")
+
+# Appended to the system prompt when encourage_parallel_tools is set:
+# models emit multi-tool responses far more often when asked, turning
+# N sequential round-trips into one round-trip plus parallel dispatch.
+_PARALLEL_TOOLS_NUDGE = (
+    "When you need multiple independent pieces of information, call all "
+    "the relevant tools in a single response so they run in parallel."
+)
+
 # Callable type for async tool dispatcher functions.
 # Receives (tool_name, tool_arguments) and returns a string result.
 ToolDispatcher = Callable[[str, dict[str, Any]], Awaitable[str]]
 
 
+@runtime_checkable
+class LLMResponseCache(Protocol):
+    """Async cache protocol for memoizing ``provider.complete`` calls."""
+
+    async def get(self, key: str) -> CompletionResult | None:
+        """Return the cached completion for *key*, or ``None``."""
+        ...
+
+    async def set(self, key: str, value: CompletionResult) -> None:
+        """Store *value* under *key*."""
+        ...
+
+
+class InMemoryLRUCache:
+    """Default in-process LRU implementation of `LLMResponseCache`.
+
+    Only useful when the provider is deterministic (temperature 0) —
+    cached completions are replayed verbatim for an identical
+    (messages, tools) prefix, skipping the network round-trip entirely.
+
+    Args:
+        maxsize: Maximum number of completions to retain; the
+            least-recently-used entry is evicted when full.
+    """
+
+    def __init__(self, maxsize: int = 512) -> None:
+        self._maxsize = maxsize
+        self._store: OrderedDict[str, CompletionResult] = OrderedDict()
+
+    async def get(self, key: str) -> CompletionResult | None:
+        result = self._store.get(key)
+        if result is not None:
+            self._store.move_to_end(key)
+        return result
+
+    async def set(self, key: str, value: CompletionResult) -> None:
+        self._store[key] = value
+        self._store.move_to_end(key)
+        while len(self._store) > self._maxsize:
+            self._store.popitem(last=False)
+
+
+def _completion_cache_key(
+    messages: list[dict[str, Any]], tools: list[ToolDefinition]
+) -> str:
+    """Hash the (messages, tools) prefix into a stable cache key."""
+    payload = _dumps_sorted({"m": messages, "t": [t.name for t in tools]})
+    return sha256(payload.encode()).hexdigest()
+
+
 class AgenticLoop:
     """Executes the LLM + tool-calling loop for a single conversation turn.
 
@@ -54,6 +143,31 @@ class AgenticLoop:
         max_iterations: Maximum number of LLM calls per turn (guard against
             infinite loops). Default: 10.
         system_prompt: Optional system message prepended to every turn.
+        response_cache: Optional `LLMResponseCache` memoizing completions
+            by (messages, tools) hash. Only enable for deterministic
+            (temperature-0) providers; ``None`` (the default) disables
+            caching.
+        cache_tool_results: When ``True``, repeated identical
+            ``(name, args)`` tool calls within a single ``run()`` reuse
+            the first dispatch's result instead of re-invoking the tool.
+            LLM traces frequently re-request the same lookup across
+            iterations; the cache lives only for the turn, so staleness
+            is bounded by turn length.
+        tool_idempotent: Optional predicate ``name -> bool`` restricting
+            the per-run cache to tools it returns ``True`` for. ``None``
+            treats every tool as idempotent when caching is enabled.
+        max_tool_concurrency: Cap on simultaneously executing tool
+            dispatches within one response. Unbounded gather over large
+            tool batches can saturate downstream APIs and trigger retry
+            storms; 8 keeps latency monotone for typical rate limits.
+        tool_handlers: Optional direct ``name -> async handler(args)``
+            mapping. Names found here are invoked with an O(1) dict
+            lookup, bypassing the generic dispatcher; unmatched names
+            fall back to ``tool_dispatcher``.
+        encourage_parallel_tools: When ``True``, append a one-line nudge
+            to the system prompt asking the model to batch independent
+            tool calls into a single response. Off by default so the
+            configured prompt is used verbatim.
     """
 
     def __init__(
@@ -62,11 +176,28 @@ class AgenticLoop:
         tool_dispatcher: ToolDispatcher,
         max_iterations: int = 10,
         system_prompt: str | None = None,
+        response_cache: LLMResponseCache | None = None,
+        cache_tool_results: bool = False,
+        tool_idempotent: Callable[[str], bool] | None = None,
+        max_tool_concurrency: int = 8,
+        tool_handlers: dict[str, Callable[[dict[str, Any]], Awaitable[str]]] | None = None,
+        encourage_parallel_tools: bool = False,
     ) -> None:
         self.provider = provider
         self.tool_dispatcher = tool_dispatcher
         self.max_iterations = max_iterations
+        if encourage_parallel_tools:
+            system_prompt = (
+                f"{system_prompt}\n{_PARALLEL_TOOLS_NUDGE}"
+                if system_prompt
+                else _PARALLEL_TOOLS_NUDGE
+            )
         self.system_prompt = system_prompt
+        self.response_cache = response_cache
+        self.cache_tool_results = cache_tool_results
+        self.tool_idempotent = tool_idempotent
+        self.max_tool_concurrency = max_tool_concurrency
+        self.tool_handlers = tool_handlers
 
     async def run(
         self,
@@ -94,18 +225,32 @@ class AgenticLoop:
         messages: list[dict[str, Any]] = []
 
         if self.system_prompt:
-            messages.append({"role": "system", "content": self.system_prompt})
+            messages.append({_ROLE: _SYSTEM, _CONTENT: self.system_prompt})
 
         messages.extend(chat_history)
-        messages.append({"role": "user", "content": user_text})
+        messages.append({_ROLE: _USER, _CONTENT: user_text})
 
         turn_start = time.monotonic()
+        # Per-run memo of idempotent tool results; discarded with the turn.
+        dispatch_cache: dict[tuple[str, str], str] | None = (
+            {} if self.cache_tool_results else None
+        )
 
         for iteration in range(self.max_iterations):
             logger.debug("Agentic loop iteration %d/%d", iteration + 1, self.max_iterations)
 
             llm_t0 = time.monotonic()
-            result: CompletionResult = await self.provider.complete(messages, tools)
+            cache_key: str | None = None
+            result: CompletionResult | None = None
+            if self.response_cache is not None:
+                cache_key = _completion_cache_key(messages, tools)
+                result = await self.response_cache.get(cache_key)
+                if result is not None:
+                    logger.debug("LLM response cache hit for call %d", iteration + 1)
+            if result is None:
+                result = await self.provider.complete(messages, tools)
+                if cache_key is not None:
+                    await self.response_cache.set(cache_key, result)
             logger.debug(
                 "LLM call %d took %.3fs (finish_reason=%s)",
                 iteration + 1,
@@ -128,7 +273,9 @@ class AgenticLoop:
 
                 # Dispatch all tool calls concurrently and collect results
                 tools_t0 = time.monotonic()
-                tool_result_messages = await self._dispatch_tool_calls(result.tool_calls)
+                tool_result_messages = await self._dispatch_tool_calls(
+                    result.tool_calls, dispatch_cache
+                )
                 logger.debug(
                     "Dispatched %d tool(s) concurrently in %.3fs",
                     len(result.tool_calls),
@@ -149,7 +296,9 @@ class AgenticLoop:
         )
 
     async def _dispatch_tool_calls(
-        self, tool_calls: list[ToolCall]
+        self,
+        tool_calls: list[ToolCall],
+        dispatch_cache: dict[tuple[str, str], str] | None = None,
     ) -> list[dict[str, Any]]:
         """Dispatch a list of tool calls concurrently and return tool result messages.
 
@@ -157,25 +306,55 @@ class AgenticLoop:
         ``asyncio.gather``, reducing latency when the LLM requests multiple
         tools in a single response.
 
+        Concurrency is capped at ``max_tool_concurrency``; the semaphore is
+        created here because it must bind to the running event loop.
+
         Args:
             tool_calls: The tool invocations requested by the LLM.
+            dispatch_cache: Optional per-run memo of ``(name, args)`` →
+                result for idempotent tools; hits skip the dispatcher.
 
         Returns:
             A list of OpenAI-format tool result messages to append to the
             conversation history.  Order matches the order of *tool_calls*.
         """
 
+        sem = asyncio.Semaphore(self.max_tool_concurrency)
+
+        def _cache_key(tc: ToolCall) -> tuple[str, str] | None:
+            if dispatch_cache is None:
+                return None
+            if self.tool_idempotent is not None and not self.tool_idempotent(tc.name):
+                return None
+            return (tc.name, _dumps_sorted(tc.arguments))
+
         async def _run_one(tc: ToolCall) -> dict[str, Any]:
+            key = _cache_key(tc)
+            if key is not None and key in dispatch_cache:
+                logger.debug("Tool dispatch cache hit: %s(%s)", tc.name, tc.arguments)
+                return {
+                    _ROLE: _TOOL,
+                    _TOOL_CALL_ID: tc.id,
+                    _CONTENT: dispatch_cache[key],
+                }
             logger.debug("Dispatching tool: %s(%s)", tc.name, tc.arguments)
+            handler = self.tool_handlers.get(tc.name) if self.tool_handlers else None
             try:
-                result_str = await self.tool_dispatcher(tc.name, tc.arguments)
+                async with sem:
+                    if handler is not None:
+                        result_str = await handler(tc.arguments)
+                    else:
+                        result_str = await self.tool_dispatcher(tc.name, tc.arguments)
             except Exception as exc:
                 logger.error("Tool %r failed: %s", tc.name, exc, exc_info=True)
-                result_str = json.dumps({"error": str(exc)})
+                result_str = _dumps({"error": str(exc)})
+            else:
+                if key is not None:
+                    dispatch_cache[key] = result_str
             return {
-                "role": "tool",
-                "tool_call_id": tc.id,
-                "content": result_str,
+                _ROLE: _TOOL,
+                _TOOL_CALL_ID: tc.id,
+                _CONTENT: result_str,
             }
 
         return list(await asyncio.gather(*[_run_one(tc) for tc in tool_calls]))
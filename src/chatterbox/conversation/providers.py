@@ -22,7 +22,8 @@ import logging
 import time
 from collections import deque
 from dataclasses import dataclass, field
-from typing import Any, Protocol, runtime_checkable
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Protocol, runtime_checkable
 
 from openai import APIConnectionError, APIStatusError, AsyncOpenAI, RateLimitError
 
@@ -126,14 +127,26 @@ class CostEstimator:
             Estimated cost in USD, or ``None`` if the model is not in the
             database.
         """
-        costs = _MODEL_COSTS.get(model)
-        if costs is None:
-            return None
-        input_cost_per_1k, output_cost_per_1k = costs
-        return (
-            prompt_tokens * input_cost_per_1k / 1000.0
-            + completion_tokens * output_cost_per_1k / 1000.0
-        )
+        return _estimate(model, prompt_tokens, completion_tokens)
+
+
+@lru_cache(maxsize=256)
+def _estimate(model: str, prompt_tokens: int, completion_tokens: int) -> float | None:
+    """Memoised cost lookup shared by all ``CostEstimator`` instances.
+
+    Token-count pairs repeat heavily across a session (identical prompts,
+    capped completions), so an ``lru_cache`` keyed on the full argument
+    tuple skips the arithmetic on repeats. Module-level rather than a
+    decorated method so the cache never keeps instances alive.
+    """
+    costs = _MODEL_COSTS.get(model)
+    if costs is None:
+        return None
+    input_cost_per_1k, output_cost_per_1k = costs
+    return (
+        prompt_tokens * input_cost_per_1k / 1000.0
+        + completion_tokens * output_cost_per_1k / 1000.0
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -155,13 +168,29 @@ class RateLimiter:
         calls_per_minute: Maximum calls allowed in any 60-second window.
     """
 
-    def __init__(self, calls_per_minute: int) -> None:
+    def __init__(
+        self,
+        calls_per_minute: int,
+        clock: Callable[[], float] = time.monotonic,
+        sleeper: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ) -> None:
+        """Initialise the limiter.
+
+        Args:
+            calls_per_minute: Maximum calls allowed in any 60-second window.
+            clock: Monotonic clock, injectable for deterministic tests
+                (mirrors the ``ToolResultCache`` pattern).
+            sleeper: Awaitable sleep function, injectable so tests never
+                wait on real timers.
+        """
         if calls_per_minute <= 0:
             raise ValueError("calls_per_minute must be a positive integer.")
         self.calls_per_minute = calls_per_minute
         self._window_seconds = 60.0
         self._timestamps: deque[float] = deque()
         self._lock = asyncio.Lock()
+        self._clock = clock
+        self._sleeper = sleeper
 
     async def acquire(self) -> None:
         """Wait until a call slot is available within the current window.
@@ -169,7 +198,7 @@ class RateLimiter:
         Should be called at the start of each LLM API request.
         """
         async with self._lock:
-            now = time.monotonic()
+            now = self._clock()
             cutoff = now - self._window_seconds
 
             # Prune timestamps older than the window.
@@ -179,7 +208,7 @@ class RateLimiter:
             if len(self._timestamps) >= self.calls_per_minute:
                 # Oldest call in window determines how long to sleep.
                 sleep_until = self._timestamps[0] + self._window_seconds
-                sleep_secs = sleep_until - time.monotonic()
+                sleep_secs = sleep_until - self._clock()
                 if sleep_secs > 0:
                     logger.debug(
                         "RateLimiter: at capacity (%d/%d), sleeping %.2fs",
@@ -187,14 +216,14 @@ class RateLimiter:
                         self.calls_per_minute,
                         sleep_secs,
                     )
-                    await asyncio.sleep(sleep_secs)
+                    await self._sleeper(sleep_secs)
                 # Prune again after sleeping.
-                now = time.monotonic()
+                now = self._clock()
                 cutoff = now - self._window_seconds
                 while self._timestamps and self._timestamps[0] < cutoff:
                     self._timestamps.popleft()
 
-            self._timestamps.append(time.monotonic())
+            self._timestamps.append(self._clock())
 
 
 # ---------------------------------------------------------------------------
@@ -202,7 +231,7 @@ class RateLimiter:
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ToolDefinition:
     """Describes a callable tool available to the LLM.
 
@@ -219,20 +248,34 @@ class ToolDefinition:
     name: str
     description: str
     parameters: dict[str, Any] = field(default_factory=dict)
+    # Memoized wire dict; definitions are built once at startup but
+    # serialised on every completion call, so cache the result.
+    _wire_format: dict[str, Any] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def to_openai_format(self) -> dict[str, Any]:
-        """Serialise to OpenAI tool definition format."""
-        return {
-            "type": "function",
-            "function": {
-                "name": self.name,
-                "description": self.description,
-                "parameters": self.parameters,
-            },
-        }
+        """Serialise to OpenAI tool definition format.
 
-
-@dataclass
+        The wire dict is built on first use and reused for subsequent
+        calls; nothing downstream mutates it. Clear ``_wire_format`` if a
+        definition is edited after first serialisation.
+        """
+        wire = self._wire_format
+        if wire is None:
+            wire = {
+                "type": "function",
+                "function": {
+                    "name": self.name,
+                    "description": self.description,
+                    "parameters": self.parameters,
+                },
+            }
+            object.__setattr__(self, "_wire_format", wire)
+        return wire
+
+
+@dataclass(slots=True, frozen=True)
 class ToolCall:
     """A tool invocation requested by the LLM.
 
@@ -247,7 +290,7 @@ class ToolCall:
     arguments: dict[str, Any]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CompletionResult:
     """Result of a single LLM completion call.
 
@@ -327,6 +370,9 @@ class OpenAICompatibleProvider:
         temperature: Sampling temperature (0.0–2.0).
         rate_limiter: Optional ``RateLimiter`` for client-side call throttling.
         cost_estimator: Optional ``CostEstimator`` for tracking USD cost.
+        parallel_tool_calls: Wire hint allowing the model to emit several
+            tool calls per response. ``None`` (default) omits the field
+            for backends that reject it.
     """
 
     def __init__(
@@ -337,12 +383,14 @@ class OpenAICompatibleProvider:
         temperature: float = 0.7,
         rate_limiter: RateLimiter | None = None,
         cost_estimator: CostEstimator | None = None,
+        parallel_tool_calls: bool | None = None,
     ) -> None:
         self.base_url = base_url
         self.model = model
         self.temperature = temperature
         self.rate_limiter = rate_limiter
         self.cost_estimator = cost_estimator
+        self.parallel_tool_calls = parallel_tool_calls
         self._client = AsyncOpenAI(base_url=base_url, api_key=api_key)
 
     async def complete(
@@ -369,6 +417,8 @@ class OpenAICompatibleProvider:
         }
         if openai_tools:
             kwargs["tools"] = openai_tools
+            if self.parallel_tool_calls is not None:
+                kwargs["parallel_tool_calls"] = self.parallel_tool_calls
 
         logger.debug(
             "LLM request: model=%s, messages=%d, tools=%d",
@@ -25,7 +25,17 @@ Quick-start example::
 """
 
 from chatterbox.conversation.tools.datetime_tool import DateTimeTool
-from chatterbox.conversation.tools.registry import AsyncToolHandler, ToolRegistry
+from chatterbox.conversation.tools.registry import (
+    AsyncToolHandler,
+    DuplicateToolError,
+    ToolRegistry,
+)
 from chatterbox.conversation.tools.weather import WeatherTool
 
-__all__ = ["AsyncToolHandler", "DateTimeTool", "ToolRegistry", "WeatherTool"]
+__all__ = [
+    "AsyncToolHandler",
+    "DateTimeTool",
+    "DuplicateToolError",
+    "ToolRegistry",
+    "WeatherTool",
+]
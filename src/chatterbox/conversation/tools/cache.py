@@ -24,13 +24,29 @@ make caching cost-effective for typical voice assistant query rates.
 
 from __future__ import annotations
 
+import asyncio
+import heapq
 import json
 import logging
 import time
+from collections import OrderedDict
+from itertools import count
 from typing import Any, Awaitable, Callable
 
 logger = logging.getLogger(__name__)
 
+try:  # optional: Rust-backed serialisation for the unhashable-args key path
+    import orjson
+
+    def _encode_args(args: dict[str, Any]) -> bytes:
+        return orjson.dumps(args, option=orjson.OPT_SORT_KEYS, default=str)
+
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+
+    def _encode_args(args: dict[str, Any]) -> bytes:
+        return json.dumps(args, sort_keys=True, default=str).encode()
+
+
 # Matches the ToolDispatcher type alias in loop.py
 _DispatcherT = Callable[[str, dict[str, Any]], Awaitable[str]]
 
@@ -44,24 +60,76 @@ class ToolResultCache:
     Args:
         ttl: Seconds before a cached entry expires.  Pass ``0.0`` or a
             negative value to disable caching (every ``get`` returns ``None``).
+        maxsize: Maximum number of entries to retain.  When full, the
+            least-recently-used entry is evicted on ``put``.
+        clock: Nanosecond monotonic clock, injectable for deterministic
+            tests.  Defaults to ``time.monotonic_ns``.
 
     Thread/task safety:
-        The cache is a plain ``dict`` — safe for single-threaded asyncio use.
-        Concurrent writes for the same key are harmless (last writer wins).
+        The cache is a plain ``OrderedDict`` — safe for single-threaded
+        asyncio use.  Concurrent writes for the same key are harmless
+        (last writer wins).
     """
 
-    def __init__(self, ttl: float = 300.0) -> None:
+    def __init__(
+        self,
+        ttl: float = 300.0,
+        maxsize: int = 1024,
+        clock: Callable[[], int] = time.monotonic_ns,
+    ) -> None:
         self._ttl = ttl
-        self._store: dict[str, tuple[str, float]] = {}
+        self._clock = clock
+        # Expiries are integer nanoseconds: the hot-path TTL comparison is
+        # then a single int compare with no FP rounding ambiguity.
+        self._ttl_ns = int(ttl * 1e9)
+        self._maxsize = maxsize
+        self._store: OrderedDict[tuple, tuple[str, int]] = OrderedDict()
+        # (expiry, seq, key) min-heap so bulk expiry is O(log n) per dead
+        # entry instead of waiting for each key to be touched again. The
+        # seq tie-breaker keeps heterogeneous keys out of comparisons.
+        self._expiry_heap: list[tuple[int, int, tuple]] = []
+        self._seq = count()
+        # L0 single-slot cache: chat loops often repeat the exact prior
+        # call, and one key comparison beats a dict lookup.
+        self._last: tuple[tuple, str, int] | None = None
+
+    def _sweep(self, now: int) -> None:
+        """Evict every entry whose TTL has elapsed.
+
+        Heap entries made stale by overwrites or invalidation are skipped
+        (the stored expiry no longer matches the heap's timestamp).
+        """
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= now:
+            expires_at, _, key = heapq.heappop(heap)
+            entry = self._store.get(key)
+            if entry is not None and entry[1] == expires_at:
+                del self._store[key]
+                logger.debug("Cache expired: %s", key)
 
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
 
     @staticmethod
-    def _make_key(name: str, args: dict[str, Any]) -> str:
-        """Return a stable string key for a ``(name, args)`` pair."""
-        return name + ":" + json.dumps(args, sort_keys=True, default=str)
+    def _make_key(name: str, args: dict[str, Any]) -> tuple:
+        """Return a stable hashable key for a ``(name, args)`` pair.
+
+        Fast path: a ``(name, sorted-items)`` tuple — a couple of tuple
+        hashes instead of a throwaway JSON string per lookup. Falls back
+        to a ``(name, serialised-bytes)`` tuple only when an arg value is
+        unhashable (dict/list-valued args).
+        """
+        if not args:
+            # Very common call shape — no sorting or hashing of an empty
+            # container needed.
+            return (name,)
+        try:
+            key = (name, tuple(sorted(args.items())))
+            hash(key)
+            return key
+        except TypeError:
+            return (name, _encode_args(args))
 
     # ------------------------------------------------------------------
     # Public interface
@@ -74,15 +142,22 @@ class ToolResultCache:
         """
         if self._ttl <= 0:
             return None
+        now = self._clock()
         key = self._make_key(name, args)
+        last = self._last
+        if last is not None and last[0] == key and now <= last[2]:
+            return last[1]
+        self._sweep(now)
         entry = self._store.get(key)
         if entry is None:
             return None
         result, expires_at = entry
-        if time.monotonic() > expires_at:
+        if now > expires_at:
             del self._store[key]
             logger.debug("Cache expired: %s", key)
             return None
+        self._store.move_to_end(key)
+        self._last = (key, result, expires_at)
         logger.debug("Cache hit: %s", key)
         return result
 
@@ -90,8 +165,17 @@ class ToolResultCache:
         """Store *result* for ``(name, args)`` with the configured TTL."""
         if self._ttl <= 0:
             return
+        now = self._clock()
+        self._sweep(now)
         key = self._make_key(name, args)
-        self._store[key] = (result, time.monotonic() + self._ttl)
+        expires_at = now + self._ttl_ns
+        self._store[key] = (result, expires_at)
+        self._store.move_to_end(key)
+        self._last = (key, result, expires_at)
+        heapq.heappush(self._expiry_heap, (expires_at, next(self._seq), key))
+        while len(self._store) > self._maxsize:
+            evicted, _ = self._store.popitem(last=False)
+            logger.debug("Cache evicted LRU entry: %s", evicted)
         logger.debug("Cache stored: %s (ttl=%.1fs)", key, self._ttl)
 
     def invalidate(self, name: str, args: dict[str, Any] | None = None) -> int:
@@ -106,12 +190,12 @@ class ToolResultCache:
         Returns:
             Number of entries removed.
         """
+        self._last = None
         if args is not None:
             key = self._make_key(name, args)
             removed = 1 if self._store.pop(key, None) is not None else 0
         else:
-            prefix = name + ":"
-            keys_to_remove = [k for k in self._store if k.startswith(prefix)]
+            keys_to_remove = [k for k in self._store if k[0] == name]
             for k in keys_to_remove:
                 del self._store[k]
             removed = len(keys_to_remove)
@@ -120,9 +204,11 @@ class ToolResultCache:
 
     def clear(self) -> None:
         """Remove all cached entries."""
-        count = len(self._store)
+        removed = len(self._store)
         self._store.clear()
-        logger.debug("Cache cleared (%d entries removed)", count)
+        self._expiry_heap.clear()
+        self._last = None
+        logger.debug("Cache cleared (%d entries removed)", removed)
 
     def __len__(self) -> int:
         """Return the number of entries currently in the cache (including expired)."""
@@ -150,12 +236,40 @@ class CachingDispatcher:
     def __init__(self, inner: _DispatcherT, cache: ToolResultCache) -> None:
         self._inner = inner
         self._cache = cache
+        # In-flight upstream calls keyed like the cache, so concurrent
+        # misses for the same (name, args) share one inner invocation.
+        self._inflight: dict[tuple, asyncio.Future[str]] = {}
 
     async def __call__(self, name: str, args: dict[str, Any]) -> str:
-        """Serve from cache or delegate to inner dispatcher and cache the result."""
+        """Serve from cache or delegate to inner dispatcher and cache the result.
+
+        Concurrent cache misses for the same key are coalesced: the first
+        caller dispatches to the inner tool and every other caller awaits
+        the same in-flight future.
+        """
         cached = self._cache.get(name, args)
         if cached is not None:
             return cached
-        result = await self._inner(name, args)
+
+        key = ToolResultCache._make_key(name, args)
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            return await inflight
+
+        fut: asyncio.Future[str] = asyncio.get_running_loop().create_future()
+        self._inflight[key] = fut
+        try:
+            result = await self._inner(name, args)
+        except BaseException as exc:
+            if not fut.cancelled():
+                fut.set_exception(exc)
+                fut.exception()  # mark retrieved; waiters still re-raise
+            raise
+        else:
+            if not fut.cancelled():
+                fut.set_result(result)
+        finally:
+            self._inflight.pop(key, None)
+
         self._cache.put(name, args, result)
         return result
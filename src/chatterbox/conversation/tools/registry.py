@@ -45,6 +45,10 @@ logger = logging.getLogger(__name__)
 AsyncToolHandler = Callable[[dict[str, Any]], Awaitable[str]]
 
 
+class DuplicateToolError(ValueError):
+    """Raised when registering a tool name that is already registered."""
+
+
 class ToolRegistry:
     """Registry mapping tool names to their definitions and async handlers.
 
@@ -78,10 +82,11 @@ class ToolRegistry:
                 the tool and returns a JSON string result.
 
         Raises:
-            ValueError: If a tool with the same name is already registered.
+            DuplicateToolError: If a tool with the same name is already
+                registered.
         """
         if definition.name in self._tools:
-            raise ValueError(
+            raise DuplicateToolError(
                 f"Tool {definition.name!r} is already registered. "
                 "Deregister it first before re-registering."
             )
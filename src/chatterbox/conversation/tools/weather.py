@@ -24,7 +24,7 @@ from __future__ import annotations
 
 import json
 import logging
-from typing import Any
+from typing import Any, Callable
 
 import httpx
 
@@ -103,8 +103,21 @@ class WeatherTool:
         },
     )
 
-    def __init__(self, timeout: float = 10.0) -> None:
+    def __init__(
+        self,
+        timeout: float = 10.0,
+        client_factory: Callable[..., httpx.AsyncClient] = httpx.AsyncClient,
+    ) -> None:
+        """Initialise the tool.
+
+        Args:
+            timeout: HTTP request timeout in seconds.
+            client_factory: Callable producing the async HTTP client,
+                injectable so tests can supply a stub without patching
+                the httpx module.
+        """
         self.timeout = timeout
+        self._client_factory = client_factory
 
     # ------------------------------------------------------------------
     # Public API
@@ -132,7 +145,7 @@ class WeatherTool:
             httpx.HTTPStatusError: If either API call returns a non-2xx status.
             httpx.TimeoutException: If a request exceeds ``self.timeout``.
         """
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
+        async with self._client_factory(timeout=self.timeout) as client:
             lat, lon, resolved_name = await self._geocode(client, location)
             return await self._fetch_conditions(client, lat, lon, resolved_name)
 
@@ -2,6 +2,7 @@
 
 import json
 import logging
+import os
 from dataclasses import dataclass
 from pathlib import Path
 from typing import List
@@ -39,10 +40,17 @@ class CorpusLoader:
     def __init__(self, corpus_dir: Path) -> None:
         self.corpus_dir = Path(corpus_dir)
         self._manifest_path = self.corpus_dir / self.MANIFEST_NAME
+        # Parsed entries keyed by manifest mtime, so repeated load_all /
+        # load_entry calls in one run skip re-reading and re-parsing the
+        # manifest while still noticing edits.
+        self._cache: "tuple[float, List[CorpusEntry]] | None" = None
 
     def load_all(self) -> List[CorpusEntry]:
         """Return all corpus entries sorted by filename.
 
+        Results are cached against the manifest's mtime; editing the
+        manifest invalidates the cache on the next call.
+
         Raises:
             FileNotFoundError: If the corpus directory or manifest is missing.
             ValueError: If the manifest JSON is malformed.
@@ -52,15 +60,22 @@ class CorpusLoader:
         if not self._manifest_path.exists():
             raise FileNotFoundError(f"Corpus manifest not found: {self._manifest_path}")
 
+        mtime = self._manifest_path.stat().st_mtime
+        if self._cache is not None and self._cache[0] == mtime:
+            return self._cache[1]
+
         try:
             raw = json.loads(self._manifest_path.read_text(encoding="utf-8"))
         except json.JSONDecodeError as exc:
             raise ValueError(f"Malformed corpus manifest: {self._manifest_path}: {exc}") from exc
 
+        # One directory listing instead of a stat syscall per manifest entry.
+        present = set(os.listdir(self.corpus_dir))
+
         entries: List[CorpusEntry] = []
         for item in raw:
             wav_path = self.corpus_dir / item["file"]
-            if not wav_path.exists():
+            if item["file"] not in present:
                 logger.warning("Corpus file missing, skipping: %s", wav_path)
                 continue
             entries.append(
@@ -72,6 +87,7 @@ class CorpusLoader:
             )
 
         entries.sort(key=lambda e: e.wav_path.name)
+        self._cache = (mtime, entries)
         logger.info("Loaded %d corpus entries from %s", len(entries), self.corpus_dir)
         return entries
 
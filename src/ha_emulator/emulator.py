@@ -2,6 +2,7 @@
 
 import asyncio
 import logging
+import struct
 import time
 import wave
 from dataclasses import dataclass, field
@@ -15,8 +16,10 @@ from wyoming.tts import Synthesize
 
 logger = logging.getLogger(__name__)
 
-# PCM chunk size sent per AudioChunk event (bytes)
-_CHUNK_SIZE = 4096
+# PCM chunk size sent per AudioChunk event (bytes). Larger chunks mean
+# fewer per-event JSON headers and drain round-trips; 16 KiB is still
+# well under half a second of 16 kHz mono audio.
+_CHUNK_SIZE = 16384
 
 
 @dataclass
@@ -128,15 +131,14 @@ class HAEmulator:
                 AudioStart(rate=rate, width=width, channels=channels).event(), writer
             )
 
-            # Stream PCM chunks
+            # Stream PCM chunks; memoryview slices share the WAV buffer
+            # instead of copying each chunk, and one AudioChunk template
+            # is reused with only its audio field swapped per event.
+            pcm_view = memoryview(pcm_data)
+            chunk = AudioChunk(rate=rate, width=width, channels=channels, audio=b"")
             for i in range(0, len(pcm_data), _CHUNK_SIZE):
-                chunk = pcm_data[i : i + _CHUNK_SIZE]
-                await async_write_event(
-                    AudioChunk(
-                        rate=rate, width=width, channels=channels, audio=chunk
-                    ).event(),
-                    writer,
-                )
+                chunk.audio = pcm_view[i : i + _CHUNK_SIZE]
+                await async_write_event(chunk.event(), writer)
 
             # Signal end of audio
             await async_write_event(AudioStop().event(), writer)
@@ -273,67 +275,46 @@ class HAEmulator:
             await async_write_event(
                 AudioStart(rate=rate, width=width, channels=channels).event(), writer
             )
+            pcm_view = memoryview(pcm_data)
+            chunk = AudioChunk(rate=rate, width=width, channels=channels, audio=b"")
             for i in range(0, len(pcm_data), _CHUNK_SIZE):
-                chunk = pcm_data[i : i + _CHUNK_SIZE]
-                await async_write_event(
-                    AudioChunk(
-                        rate=rate, width=width, channels=channels, audio=chunk
-                    ).event(),
-                    writer,
-                )
+                chunk.audio = pcm_view[i : i + _CHUNK_SIZE]
+                await async_write_event(chunk.event(), writer)
             await async_write_event(AudioStop().event(), writer)
 
-            # Read events until we have both transcript and audio
-            transcript_text = ""
-            audio_rate = 22050
-            audio_width = 2
-            audio_channels = 1
+            # Read events until we have both transcript and audio; one
+            # wait_for budgets the whole exchange, and shared state keeps
+            # partial results available when it expires.
+            state = {
+                "transcript": "",
+                "rate": 22050,
+                "width": 2,
+                "channels": 1,
+            }
             chunks: list = []
-            deadline = time.monotonic() + self.timeout
-
-            while time.monotonic() < deadline:
-                remaining = deadline - time.monotonic()
-                try:
-                    event = await asyncio.wait_for(
-                        async_read_event(reader), timeout=remaining
-                    )
-                except asyncio.TimeoutError:
-                    break
-                except Exception as exc:
-                    return PTTResult(
-                        transcript=transcript_text,
-                        audio_bytes=b"".join(chunks),
-                        audio_rate=audio_rate,
-                        audio_width=audio_width,
-                        audio_channels=audio_channels,
-                        round_trip_ms=(time.monotonic() - t0) * 1000.0,
-                        success=False,
-                        error=f"Read error: {exc}",
-                    )
-
-                if event is None:
-                    break
-
-                if event.type == "transcript":
-                    transcript_text = (event.data or {}).get("text", "")
-                    logger.debug("PTT Transcript: %r", transcript_text)
-                elif event.type == "audio-start":
-                    d = event.data or {}
-                    audio_rate = d.get("rate", audio_rate)
-                    audio_width = d.get("width", audio_width)
-                    audio_channels = d.get("channels", audio_channels)
-                elif event.type == "audio-chunk":
-                    payload = getattr(event, "payload", None) or (
-                        event.data or {}
-                    ).get("audio", b"")
-                    if payload:
-                        chunks.append(payload)
-                elif event.type == "audio-stop":
-                    logger.debug("PTT AudioStop received — round-trip complete")
-                    break
-                else:
-                    logger.debug("PTT skipping event: %s", event.type)
+            try:
+                read_error = await asyncio.wait_for(
+                    self._read_ptt(reader, state, chunks), timeout=self.timeout
+                )
+            except asyncio.TimeoutError:
+                read_error = None
+
+            if read_error is not None:
+                return PTTResult(
+                    transcript=state["transcript"],
+                    audio_bytes=b"".join(chunks),
+                    audio_rate=state["rate"],
+                    audio_width=state["width"],
+                    audio_channels=state["channels"],
+                    round_trip_ms=(time.monotonic() - t0) * 1000.0,
+                    success=False,
+                    error=read_error,
+                )
 
+            transcript_text = state["transcript"]
+            audio_rate = state["rate"]
+            audio_width = state["width"]
+            audio_channels = state["channels"]
             audio_bytes = b"".join(chunks)
             round_trip_ms = (time.monotonic() - t0) * 1000.0
 
@@ -368,19 +349,64 @@ class HAEmulator:
     # Internal helpers
     # ------------------------------------------------------------------
 
+    async def _read_ptt(
+        self, reader: asyncio.StreamReader, state: dict, chunks: list
+    ) -> Optional[str]:
+        """Inner read loop for ``run_ptt`` (no timeout).
+
+        Mutates *state* and *chunks* in place; returns an error message
+        on read failure, ``None`` on AudioStop or connection close.
+        """
+        while True:
+            try:
+                event = await async_read_event(reader)
+            except Exception as exc:
+                return f"Read error: {exc}"
+
+            if event is None:
+                return None
+
+            if event.type == "transcript":
+                state["transcript"] = (event.data or {}).get("text", "")
+                logger.debug("PTT Transcript: %r", state["transcript"])
+            elif event.type == "audio-start":
+                d = event.data or {}
+                state["rate"] = d.get("rate", state["rate"])
+                state["width"] = d.get("width", state["width"])
+                state["channels"] = d.get("channels", state["channels"])
+            elif event.type == "audio-chunk":
+                payload = getattr(event, "payload", None) or (
+                    event.data or {}
+                ).get("audio", b"")
+                if payload:
+                    chunks.append(payload)
+            elif event.type == "audio-stop":
+                logger.debug("PTT AudioStop received — round-trip complete")
+                return None
+            else:
+                logger.debug("PTT skipping event: %s", event.type)
+
     async def _wait_for_transcript(
         self, reader: asyncio.StreamReader
     ) -> tuple:
-        """Read events until a ``transcript`` event arrives or timeout."""
-        deadline = time.monotonic() + self.timeout
-        while time.monotonic() < deadline:
-            remaining = deadline - time.monotonic()
+        """Read events until a ``transcript`` event arrives or timeout.
+
+        One wait_for wraps the whole loop: a single timer covers the
+        operation instead of a task + timer per event plus deadline
+        arithmetic on every iteration.
+        """
+        try:
+            return await asyncio.wait_for(
+                self._read_transcript(reader), timeout=self.timeout
+            )
+        except asyncio.TimeoutError:
+            return None, "Timeout waiting for Transcript"
+
+    async def _read_transcript(self, reader: asyncio.StreamReader) -> tuple:
+        """Inner read loop for ``_wait_for_transcript`` (no timeout)."""
+        while True:
             try:
-                event = await asyncio.wait_for(
-                    async_read_event(reader), timeout=remaining
-                )
-            except asyncio.TimeoutError:
-                return None, "Timeout waiting for Transcript"
+                event = await async_read_event(reader)
             except Exception as exc:
                 return None, f"Read error: {exc}"
 
@@ -394,60 +420,71 @@ class HAEmulator:
 
             logger.debug("Skipping event: %s", event.type)
 
-        return None, "Timeout waiting for Transcript"
-
     async def _collect_audio(
         self, reader: asyncio.StreamReader
     ) -> TTSResult:
-        """Collect AudioStart / AudioChunk / AudioStop from the server."""
-        audio_rate = 22050
-        audio_width = 2
-        audio_channels = 1
+        """Collect AudioStart / AudioChunk / AudioStop from the server.
+
+        A single wait_for budgets the whole stream; *state* and *chunks*
+        live outside the cancelled coroutine so partial audio is still
+        reported on timeout.
+        """
+        state = {"rate": 22050, "width": 2, "channels": 1}
         chunks: list = []
-        stream_started = False
-        deadline = time.monotonic() + self.timeout
+        try:
+            return await asyncio.wait_for(
+                self._read_audio(reader, state, chunks), timeout=self.timeout
+            )
+        except asyncio.TimeoutError:
+            return TTSResult(
+                audio_bytes=b"".join(chunks),
+                audio_rate=state["rate"],
+                audio_width=state["width"],
+                audio_channels=state["channels"],
+                latency_ms=0.0,
+                success=False,
+                error="Timeout waiting for audio stream",
+            )
 
-        while time.monotonic() < deadline:
-            remaining = deadline - time.monotonic()
+    async def _read_audio(
+        self, reader: asyncio.StreamReader, state: dict, chunks: list
+    ) -> TTSResult:
+        """Inner read loop for ``_collect_audio`` (no timeout)."""
+        while True:
             try:
-                event = await asyncio.wait_for(
-                    async_read_event(reader), timeout=remaining
-                )
-            except asyncio.TimeoutError:
+                event = await async_read_event(reader)
+            except Exception as exc:
                 return TTSResult(
                     audio_bytes=b"".join(chunks),
-                    audio_rate=audio_rate,
-                    audio_width=audio_width,
-                    audio_channels=audio_channels,
+                    audio_rate=state["rate"],
+                    audio_width=state["width"],
+                    audio_channels=state["channels"],
                     latency_ms=0.0,
                     success=False,
-                    error="Timeout waiting for audio stream",
+                    error=f"Read error: {exc}",
                 )
-            except Exception as exc:
+
+            if event is None:
                 return TTSResult(
                     audio_bytes=b"".join(chunks),
-                    audio_rate=audio_rate,
-                    audio_width=audio_width,
-                    audio_channels=audio_channels,
+                    audio_rate=state["rate"],
+                    audio_width=state["width"],
+                    audio_channels=state["channels"],
                     latency_ms=0.0,
                     success=False,
-                    error=f"Read error: {exc}",
+                    error="Connection closed before AudioStop",
                 )
 
-            if event is None:
-                break
-
             if event.type == "audio-start":
                 d = event.data or {}
-                audio_rate = d.get("rate", audio_rate)
-                audio_width = d.get("width", audio_width)
-                audio_channels = d.get("channels", audio_channels)
-                stream_started = True
+                state["rate"] = d.get("rate", state["rate"])
+                state["width"] = d.get("width", state["width"])
+                state["channels"] = d.get("channels", state["channels"])
                 logger.debug(
                     "AudioStart: rate=%d width=%d channels=%d",
-                    audio_rate,
-                    audio_width,
-                    audio_channels,
+                    state["rate"],
+                    state["width"],
+                    state["channels"],
                 )
             elif event.type == "audio-chunk":
                 payload = getattr(event, "payload", None) or (event.data or {}).get(
@@ -460,33 +497,57 @@ class HAEmulator:
                 logger.debug("AudioStop received")
                 return TTSResult(
                     audio_bytes=b"".join(chunks),
-                    audio_rate=audio_rate,
-                    audio_width=audio_width,
-                    audio_channels=audio_channels,
+                    audio_rate=state["rate"],
+                    audio_width=state["width"],
+                    audio_channels=state["channels"],
                     latency_ms=0.0,
                     success=True,
                 )
             else:
                 logger.debug("Skipping event: %s", event.type)
 
-        return TTSResult(
-            audio_bytes=b"".join(chunks),
-            audio_rate=audio_rate,
-            audio_width=audio_width,
-            audio_channels=audio_channels,
-            latency_ms=0.0,
-            success=False,
-            error="Connection closed before AudioStop",
-        )
-
 
 # ------------------------------------------------------------------
 # WAV I/O helpers (no external deps beyond stdlib)
 # ------------------------------------------------------------------
 
 
+# Canonical 44-byte PCM WAV header: RIFF chunk, "fmt " chunk (16 bytes),
+# "data" chunk — the layout the wave module itself writes.
+_WAV_HDR = struct.Struct("<4sI4s4sIHHIIHH4sI")
+
+
 def _read_wav(wav_path: Path) -> tuple:
     """Read a WAV file and return (pcm_data, rate, width, channels)."""
+    data = Path(wav_path).read_bytes()
+    if len(data) >= _WAV_HDR.size:
+        (
+            riff,
+            _,
+            wave_id,
+            fmt_id,
+            fmt_size,
+            audio_fmt,
+            channels,
+            rate,
+            _,
+            _,
+            bits,
+            data_id,
+            data_size,
+        ) = _WAV_HDR.unpack_from(data)
+        if (
+            riff == b"RIFF"
+            and wave_id == b"WAVE"
+            and fmt_id == b"fmt "
+            and fmt_size == 16
+            and audio_fmt == 1  # uncompressed PCM
+            and data_id == b"data"
+        ):
+            pcm_data = data[_WAV_HDR.size : _WAV_HDR.size + data_size]
+            return pcm_data, rate, bits // 8, channels
+
+    # Fallback: non-canonical chunk layout — let the wave module parse it.
     with wave.open(str(wav_path), "rb") as wf:
         rate = wf.getframerate()
         width = wf.getsampwidth()
@@ -50,6 +50,17 @@ warnings.filterwarnings(
 )
 
 
+@pytest.fixture(scope="session")
+def anyio_backend() -> str:
+    """Pin anyio-marked tests to the asyncio backend only.
+
+    The code under test uses asyncio primitives exclusively; without this
+    pin the anyio plugin parametrizes every marked test over each
+    installed backend, doubling collection and runtime for no coverage.
+    """
+    return "asyncio"
+
+
 def pytest_configure(config):
     """Configure pytest additional settings."""
     # Register warnings as expected and should not fail tests
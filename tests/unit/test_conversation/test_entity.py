@@ -1,9 +1,16 @@
-"""Unit tests for chatterbox.conversation.entity.ChatterboxConversationEntity."""
+"""Unit tests for chatterbox.conversation.entity.ChatterboxConversationEntity.
+
+The shared provider/dispatcher/entity fixtures are process-local and every
+piece of cross-test state is rebuilt by the autouse reset fixture, so this
+module parallelizes cleanly under ``pytest -n auto`` (pytest-xdist gives
+each worker its own fixture instances).
+"""
 
 from __future__ import annotations
 
-from typing import Any
-from unittest.mock import AsyncMock, patch
+import re
+from typing import Any, Iterator
+from unittest.mock import AsyncMock, call
 
 import pytest
 
@@ -24,20 +31,82 @@ from chatterbox.conversation.providers import (
 # ---------------------------------------------------------------------------
 
 
-def _make_entity(loop_response: str = "Test response") -> ChatterboxConversationEntity:
-    """Create an entity with a mocked AgenticLoop."""
-    provider = AsyncMock(spec=LLMProvider)
+class _RunStub:
+    """Minimal async stand-in for ``entity._loop.run``.
+
+    Records calls like a mock but skips AsyncMock's spec introspection and
+    wrapper machinery, which dominate runtime in these small tests. Set
+    ``return_value`` (or mutate it between turns) for the success path and
+    ``side_effect`` to an exception for the error path or to an iterator
+    of responses for multi-turn sequences.
+    """
+
+    def __init__(
+        self,
+        return_value: str = "Test response",
+        side_effect: BaseException | Iterator[str] | None = None,
+    ) -> None:
+        self.return_value = return_value
+        self.side_effect = side_effect
+        self.call_count = 0
+        self.call_args: Any = None
+
+    async def __call__(self, *args: Any, **kwargs: Any) -> str:
+        self.call_count += 1
+        self.call_args = call(*args, **kwargs)
+        if self.side_effect is not None:
+            if isinstance(self.side_effect, BaseException):
+                raise self.side_effect
+            return next(self.side_effect)
+        return self.return_value
+
+    def assert_called_once(self) -> None:
+        assert self.call_count == 1, f"expected 1 call, got {self.call_count}"
+
+
+@pytest.fixture(scope="session")
+def provider() -> AsyncMock:
+    """One AsyncMock(spec=LLMProvider) for the whole test session.
+
+    ``spec=`` introspection walks the full protocol signature on every
+    construction; building the mock once and resetting it per test keeps
+    that cost out of each test. The provider is never invoked directly —
+    every test replaces ``entity._loop.run``.
+    """
+    return AsyncMock(spec=LLMProvider)
+
+
+@pytest.fixture(scope="session")
+def dispatcher():
+    """One no-op async dispatcher shared by every test."""
 
     async def noop_dispatcher(name: str, args: dict[str, Any]) -> str:
         return "tool_result"
 
-    entity = ChatterboxConversationEntity(
+    return noop_dispatcher
+
+
+@pytest.fixture(scope="module")
+def entity(provider: AsyncMock, dispatcher) -> ChatterboxConversationEntity:
+    """One default-config entity shared by the module.
+
+    Construction runs AgenticLoop.__init__ each time; the default-config
+    tests only need fresh history and a fresh loop stub, which the autouse
+    reset below provides. Tests needing non-default constructor arguments
+    build their own instance.
+    """
+    return ChatterboxConversationEntity(
         provider=provider,
-        tool_dispatcher=noop_dispatcher,
+        tool_dispatcher=dispatcher,
     )
-    # Patch the loop's run method directly
-    entity._loop.run = AsyncMock(return_value=loop_response)
-    return entity
+
+
+@pytest.fixture(autouse=True)
+def _reset_entity(entity: ChatterboxConversationEntity, provider: AsyncMock) -> None:
+    """Give every test clean histories and a fresh loop stub."""
+    provider.reset_mock()
+    entity._histories.clear()
+    entity._loop.run = _RunStub()
 
 
 # ---------------------------------------------------------------------------
@@ -45,20 +114,37 @@ def _make_entity(loop_response: str = "Test response") -> ChatterboxConversation
 # ---------------------------------------------------------------------------
 
 
-@pytest.mark.anyio
-async def test_async_process_returns_conversation_result() -> None:
-    entity = _make_entity("Hello there!")
-    user_input = ConversationInput(text="Hi")
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "response,conversation_id",
+    [
+        ("Hello there!", None),
+        ("Response", "sess-42"),
+    ],
+)
+async def test_async_process_returns_conversation_result(
+    entity: ChatterboxConversationEntity, response: str, conversation_id: str | None
+) -> None:
+    """The result carries the loop's response and echoes the session id.
+
+    One await covers the response-text, id-echo and no-id cases; the
+    tuple comparison checks all fields in a single assertion.
+    """
+    entity._loop.run.return_value = response
+    user_input = ConversationInput(text="Hi", conversation_id=conversation_id)
 
     result = await entity.async_process(user_input)
 
-    assert isinstance(result, ConversationResult)
-    assert result.response_text == "Hello there!"
+    assert (type(result), result.response_text, result.conversation_id) == (
+        ConversationResult,
+        response,
+        conversation_id,
+    )
 
 
-@pytest.mark.anyio
-async def test_async_process_passes_user_text_to_loop() -> None:
-    entity = _make_entity("OK")
+@pytest.mark.asyncio
+async def test_async_process_passes_user_text_to_loop(entity: ChatterboxConversationEntity) -> None:
+    entity._loop.run.return_value = "OK"
     await entity.async_process(ConversationInput(text="What time is it?"))
 
     entity._loop.run.assert_called_once()
@@ -69,37 +155,19 @@ async def test_async_process_passes_user_text_to_loop() -> None:
     )
 
 
-@pytest.mark.anyio
-async def test_async_process_echoes_conversation_id() -> None:
-    entity = _make_entity("Response")
-    user_input = ConversationInput(text="Hello", conversation_id="sess-42")
-
-    result = await entity.async_process(user_input)
-
-    assert result.conversation_id == "sess-42"
-
-
-@pytest.mark.anyio
-async def test_async_process_no_conversation_id_returns_none() -> None:
-    entity = _make_entity("Response")
-    result = await entity.async_process(ConversationInput(text="Hello"))
-
-    assert result.conversation_id is None
-
-
 # ---------------------------------------------------------------------------
 # Chat history management
 # ---------------------------------------------------------------------------
 
 
-@pytest.mark.anyio
-async def test_multi_turn_history_accumulated() -> None:
+@pytest.mark.asyncio
+async def test_multi_turn_history_accumulated(entity: ChatterboxConversationEntity) -> None:
     """Second turn should receive the first turn's history."""
-    entity = _make_entity("First response")
+    entity._loop.run.return_value = "First response"
     input1 = ConversationInput(text="First message", conversation_id="sess-1")
     await entity.async_process(input1)
 
-    entity._loop.run = AsyncMock(return_value="Second response")
+    entity._loop.run.return_value = "Second response"
     input2 = ConversationInput(text="Second message", conversation_id="sess-1")
     await entity.async_process(input2)
 
@@ -111,55 +179,42 @@ async def test_multi_turn_history_accumulated() -> None:
     assert history[1] == {"role": "assistant", "content": "First response"}
 
 
-@pytest.mark.anyio
-async def test_sessions_are_isolated() -> None:
-    """Different conversation_ids must not share history."""
-    entity = _make_entity("Resp A")
-    await entity.async_process(ConversationInput(text="Session A", conversation_id="A"))
-
-    entity._loop.run = AsyncMock(return_value="Resp B")
-    await entity.async_process(ConversationInput(text="Session B", conversation_id="B"))
-
-    # Capture last call args for session B
-    call_args = entity._loop.run.call_args
-    # Use kwargs if present, else fall back to positional arg 1
-    if "chat_history" in call_args.kwargs:
-        history = call_args.kwargs["chat_history"]
-    else:
-        history = call_args.args[1]
-    # Session B should have empty history (no spillover from A)
-    assert history == []
-
-
 # ---------------------------------------------------------------------------
-# History management methods
+# Session isolation and history management methods
 # ---------------------------------------------------------------------------
 
 
-@pytest.mark.anyio
-async def test_clear_history_removes_session() -> None:
-    entity = _make_entity("R")
-    await entity.async_process(ConversationInput(text="Hi", conversation_id="sess-x"))
-    assert "sess-x" in entity._histories
-
-    entity.clear_history("sess-x")
-    assert "sess-x" not in entity._histories
-
-
-@pytest.mark.anyio
-async def test_clear_all_history() -> None:
-    entity = _make_entity("R")
-    await entity.async_process(ConversationInput(text="Hi", conversation_id="A"))
-    await entity.async_process(ConversationInput(text="Hi", conversation_id="B"))
-    assert len(entity._histories) == 2
-
-    entity.clear_all_history()
-    assert entity._histories == {}
+@pytest.mark.asyncio
+@pytest.mark.parametrize("op", ["isolate", "clear_one", "clear_all"])
+async def test_session_bookkeeping(
+    entity: ChatterboxConversationEntity, op: str
+) -> None:
+    """Sessions are isolated and both clear APIs drop stored history.
 
+    One driver runs two sessions through the entity; the parameter picks
+    which property to assert, sharing the setup across all three cases.
+    """
+    await entity.async_process(ConversationInput(text="Session A", conversation_id="A"))
+    entity._loop.run.return_value = "Resp B"
+    await entity.async_process(ConversationInput(text="Session B", conversation_id="B"))
 
-# ---------------------------------------------------------------------------
-# ToolDefinition wiring
-# ---------------------------------------------------------------------------
+    if op == "isolate":
+        # Capture last call args for session B — use kwargs if present,
+        # else fall back to positional arg 1
+        call_args = entity._loop.run.call_args
+        if "chat_history" in call_args.kwargs:
+            history = call_args.kwargs["chat_history"]
+        else:
+            history = call_args.args[1]
+        # Session B should have empty history (no spillover from A)
+        assert history == []
+    elif op == "clear_one":
+        entity.clear_history("A")
+        assert "A" not in entity._histories
+        assert "B" in entity._histories
+    else:
+        entity.clear_all_history()
+        assert entity._histories == {}
 
 
 # ---------------------------------------------------------------------------
@@ -167,39 +222,50 @@ async def test_clear_all_history() -> None:
 # ---------------------------------------------------------------------------
 
 
-@pytest.mark.anyio
-async def test_async_process_handles_runtime_error_gracefully() -> None:
-    """RuntimeError from the loop (max_iterations) should return an error message."""
-    entity = _make_entity()
-    entity._loop.run = AsyncMock(side_effect=RuntimeError("max_iterations exceeded"))
-
-    result = await entity.async_process(ConversationInput(text="Loop me forever"))
-
-    assert isinstance(result, ConversationResult)
-    assert "sorry" in result.response_text.lower()
+# Loop failures exercised by the graceful-handling tests, built once at
+# module scope and shared across the parametrized cases.
+_LOOP_ERRORS = [
+    RuntimeError("max_iterations exceeded"),
+    ConnectionError("API unreachable"),
+    LLMRateLimitError("429 too many requests"),
+    LLMConnectionError("no route to host"),
+    LLMAPIError("server error", status_code=500),
+]
 
 
-@pytest.mark.anyio
-async def test_async_process_handles_unexpected_exception_gracefully() -> None:
-    """Unexpected exceptions (e.g. LLM API errors) should return an error message."""
-    entity = _make_entity()
-    entity._loop.run = AsyncMock(side_effect=ConnectionError("API unreachable"))
+@pytest.mark.asyncio
+@pytest.mark.parametrize("exc", _LOOP_ERRORS, ids=lambda e: type(e).__name__)
+async def test_async_process_handles_loop_errors_gracefully(
+    entity: ChatterboxConversationEntity, exc: BaseException
+) -> None:
+    """Every loop failure should come back as a spoken apology, not a raise."""
+    entity._loop.run = _RunStub(side_effect=exc)
 
-    result = await entity.async_process(ConversationInput(text="What's the weather?"))
+    result = await entity.async_process(ConversationInput(text="Hello"))
 
     assert isinstance(result, ConversationResult)
-    assert "sorry" in result.response_text.lower()
+    text = result.response_text.lower()
+    assert "sorry" in text
+    if isinstance(exc, LLMRateLimitError):
+        assert "try again" in text
 
 
-@pytest.mark.anyio
-async def test_history_not_updated_on_loop_error() -> None:
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "exc",
+    [RuntimeError("boom"), LLMConnectionError("unreachable")],
+    ids=lambda e: type(e).__name__,
+)
+async def test_history_not_updated_on_loop_error(
+    entity: ChatterboxConversationEntity, exc: BaseException
+) -> None:
     """Failed turns must not pollute the session history."""
-    entity = _make_entity("First ok")
+    entity._loop.run.return_value = "First ok"
     await entity.async_process(ConversationInput(text="First", conversation_id="sess"))
     assert len(entity._histories["sess"]) == 2  # user + assistant
 
     # Second turn fails
-    entity._loop.run = AsyncMock(side_effect=RuntimeError("boom"))
+    entity._loop.run = _RunStub(side_effect=exc)
     await entity.async_process(
         ConversationInput(text="Second (fails)", conversation_id="sess")
     )
@@ -208,11 +274,17 @@ async def test_history_not_updated_on_loop_error() -> None:
     assert len(entity._histories["sess"]) == 2
 
 
-@pytest.mark.anyio
-async def test_error_response_echoes_conversation_id() -> None:
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "exc",
+    [RuntimeError("boom"), LLMRateLimitError("limited")],
+    ids=lambda e: type(e).__name__,
+)
+async def test_error_response_echoes_conversation_id(
+    entity: ChatterboxConversationEntity, exc: BaseException
+) -> None:
     """Error responses must still echo the conversation_id so the caller can track sessions."""
-    entity = _make_entity()
-    entity._loop.run = AsyncMock(side_effect=RuntimeError("boom"))
+    entity._loop.run = _RunStub(side_effect=exc)
 
     result = await entity.async_process(
         ConversationInput(text="Help", conversation_id="sess-err")
@@ -226,15 +298,10 @@ async def test_error_response_echoes_conversation_id() -> None:
 # ---------------------------------------------------------------------------
 
 
-@pytest.mark.anyio
-async def test_tools_passed_to_loop() -> None:
+@pytest.mark.asyncio
+async def test_tools_passed_to_loop(provider: AsyncMock, dispatcher) -> None:
     from chatterbox.conversation.providers import ToolDefinition
 
-    provider = AsyncMock(spec=LLMProvider)
-
-    async def noop_dispatcher(name: str, args: dict[str, Any]) -> str:
-        return "result"
-
     weather_tool = ToolDefinition(
         name="get_weather",
         description="Get weather",
@@ -242,10 +309,10 @@ async def test_tools_passed_to_loop() -> None:
     )
     entity = ChatterboxConversationEntity(
         provider=provider,
-        tool_dispatcher=noop_dispatcher,
+        tool_dispatcher=dispatcher,
         tools=[weather_tool],
     )
-    entity._loop.run = AsyncMock(return_value="Sunny")
+    entity._loop.run = _RunStub("Sunny")
 
     await entity.async_process(ConversationInput(text="Weather?"))
 
@@ -255,121 +322,51 @@ async def test_tools_passed_to_loop() -> None:
     assert tools_passed[0].name == "get_weather"
 
 
-# ---------------------------------------------------------------------------
-# LLM-specific exception handling (Task 4.7)
-# ---------------------------------------------------------------------------
-
-
-@pytest.mark.anyio
-async def test_async_process_handles_rate_limit_error() -> None:
-    entity = _make_entity()
-    entity._loop.run = AsyncMock(side_effect=LLMRateLimitError("429 too many requests"))
-
-    result = await entity.async_process(ConversationInput(text="Hello"))
-
-    assert isinstance(result, ConversationResult)
-    assert "sorry" in result.response_text.lower()
-    assert "try again" in result.response_text.lower()
-
-
-@pytest.mark.anyio
-async def test_async_process_handles_connection_error() -> None:
-    entity = _make_entity()
-    entity._loop.run = AsyncMock(side_effect=LLMConnectionError("no route to host"))
-
-    result = await entity.async_process(ConversationInput(text="Hello"))
-
-    assert isinstance(result, ConversationResult)
-    assert "sorry" in result.response_text.lower()
-
-
-@pytest.mark.anyio
-async def test_async_process_handles_api_error() -> None:
-    entity = _make_entity()
-    entity._loop.run = AsyncMock(
-        side_effect=LLMAPIError("server error", status_code=500)
-    )
-
-    result = await entity.async_process(ConversationInput(text="Hello"))
-
-    assert isinstance(result, ConversationResult)
-    assert "sorry" in result.response_text.lower()
-
-
-@pytest.mark.anyio
-async def test_rate_limit_error_echoes_conversation_id() -> None:
-    entity = _make_entity()
-    entity._loop.run = AsyncMock(side_effect=LLMRateLimitError("limited"))
-
-    result = await entity.async_process(
-        ConversationInput(text="Hello", conversation_id="sess-rl")
-    )
-    assert result.conversation_id == "sess-rl"
-
-
-@pytest.mark.anyio
-async def test_connection_error_does_not_pollute_history() -> None:
-    entity = _make_entity("First ok")
-    await entity.async_process(ConversationInput(text="First", conversation_id="sess"))
-    assert len(entity._histories["sess"]) == 2
-
-    entity._loop.run = AsyncMock(side_effect=LLMConnectionError("unreachable"))
-    await entity.async_process(
-        ConversationInput(text="Second (fails)", conversation_id="sess")
-    )
-
-    # History should still only contain the first successful turn
-    assert len(entity._histories["sess"]) == 2
-
-
 # ---------------------------------------------------------------------------
 # Task 4.8: max_history_turns truncation
 # ---------------------------------------------------------------------------
 
 
 def _make_entity_with_limit(
-    max_turns: int, response: str = "R"
+    provider: AsyncMock, dispatcher, max_turns: int, response: str = "R"
 ) -> ChatterboxConversationEntity:
     """Create an entity with max_history_turns=max_turns."""
-    provider = AsyncMock(spec=LLMProvider)
-
-    async def noop(name: str, args: dict[str, Any]) -> str:
-        return "result"
-
     entity = ChatterboxConversationEntity(
         provider=provider,
-        tool_dispatcher=noop,
+        tool_dispatcher=dispatcher,
         max_history_turns=max_turns,
     )
-    entity._loop.run = AsyncMock(return_value=response)
+    entity._loop.run = _RunStub(response)
     return entity
 
 
-@pytest.mark.anyio
-async def test_history_not_truncated_when_within_limit() -> None:
+@pytest.mark.asyncio
+async def test_history_not_truncated_when_within_limit(provider: AsyncMock, dispatcher) -> None:
     """When turns < max_history_turns, nothing is dropped."""
-    entity = _make_entity_with_limit(max_turns=3)
-    for i in range(2):
-        entity._loop.run = AsyncMock(return_value=f"R{i}")
-        await entity.async_process(ConversationInput(text=f"Q{i}", conversation_id="s"))
+    entity = _make_entity_with_limit(provider, dispatcher, max_turns=3)
+    questions = [f"Q{i}" for i in range(2)]
+    entity._loop.run.side_effect = iter(f"R{i}" for i in range(2))
+    for question in questions:
+        await entity.async_process(ConversationInput(text=question, conversation_id="s"))
 
     # 2 turns = 4 messages; limit is 3 turns = 6 messages — no truncation
     assert len(entity._histories["s"]) == 4
 
 
-@pytest.mark.anyio
-async def test_history_truncated_when_over_limit() -> None:
+@pytest.mark.asyncio
+async def test_history_truncated_when_over_limit(provider: AsyncMock, dispatcher) -> None:
     """History window drops the oldest turns once the limit is exceeded."""
-    entity = _make_entity_with_limit(max_turns=2)
+    entity = _make_entity_with_limit(provider, dispatcher, max_turns=2)
     # Add 3 turns worth of history
-    for i in range(3):
-        entity._loop.run = AsyncMock(return_value=f"R{i}")
-        await entity.async_process(ConversationInput(text=f"Q{i}", conversation_id="s"))
-
-    # The stored history grows naturally after each successful turn.
-    # After 3 turns the raw store = 6 messages.  The NEXT call will pass
-    # _truncate_history over those 6, keeping only the last 4 (2 turns).
-    entity._loop.run = AsyncMock(return_value="R3")
+    questions = [f"Q{i}" for i in range(3)]
+    entity._loop.run.side_effect = iter(f"R{i}" for i in range(3))
+    for question in questions:
+        await entity.async_process(ConversationInput(text=question, conversation_id="s"))
+
+    # The bounded per-session deque keeps only the last 2 turns (4
+    # messages), so the NEXT call sees at most that window.
+    entity._loop.run.side_effect = None
+    entity._loop.run.return_value = "R3"
     await entity.async_process(ConversationInput(text="Q3", conversation_id="s"))
 
     # The history passed to the loop on the last call should be ≤ max*2
@@ -378,13 +375,14 @@ async def test_history_truncated_when_over_limit() -> None:
     assert len(history_passed) <= 2 * 2  # max_history_turns=2 → 4 messages
 
 
-@pytest.mark.anyio
-async def test_max_history_turns_zero_disables_truncation() -> None:
+@pytest.mark.asyncio
+async def test_max_history_turns_zero_disables_truncation(provider: AsyncMock, dispatcher) -> None:
     """Setting max_history_turns=0 disables truncation entirely."""
-    entity = _make_entity_with_limit(max_turns=0)
-    for i in range(5):
-        entity._loop.run = AsyncMock(return_value=f"R{i}")
-        await entity.async_process(ConversationInput(text=f"Q{i}", conversation_id="s"))
+    entity = _make_entity_with_limit(provider, dispatcher, max_turns=0)
+    questions = [f"Q{i}" for i in range(5)]
+    entity._loop.run.side_effect = iter(f"R{i}" for i in range(5))
+    for question in questions:
+        await entity.async_process(ConversationInput(text=question, conversation_id="s"))
 
     assert len(entity._histories["s"]) == 10  # 5 turns × 2 messages, nothing dropped
 
@@ -393,42 +391,38 @@ async def test_max_history_turns_zero_disables_truncation() -> None:
 # Task 4.8: auto_create_conversation_id
 # ---------------------------------------------------------------------------
 
+# Compiled once: asserting the canonical 8-4-4-4-12 UUID4 shape is
+# stricter than a bare length check without a per-test re.compile.
+_UUID4_RE = re.compile(
+    r"[0-9a-f]{8}-[0-9a-f]{4}-4[0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}"
+)
 
-@pytest.mark.anyio
-async def test_auto_create_conversation_id_generates_id() -> None:
-    """When auto_create_conversation_id=True and no id given, one is created."""
-    provider = AsyncMock(spec=LLMProvider)
-
-    async def noop(name: str, args: dict[str, Any]) -> str:
-        return "r"
 
+@pytest.mark.asyncio
+async def test_auto_create_conversation_id_generates_id(provider: AsyncMock, dispatcher) -> None:
+    """When auto_create_conversation_id=True and no id given, one is created."""
     entity = ChatterboxConversationEntity(
         provider=provider,
-        tool_dispatcher=noop,
+        tool_dispatcher=dispatcher,
         auto_create_conversation_id=True,
     )
-    entity._loop.run = AsyncMock(return_value="Hello")
+    entity._loop.run = _RunStub("Hello")
 
     result = await entity.async_process(ConversationInput(text="Hi"))
 
     assert result.conversation_id is not None
-    assert len(result.conversation_id) == 36  # UUID4 format: 8-4-4-4-12
+    assert _UUID4_RE.fullmatch(result.conversation_id)
 
 
-@pytest.mark.anyio
-async def test_auto_create_conversation_id_stores_history() -> None:
+@pytest.mark.asyncio
+async def test_auto_create_conversation_id_stores_history(provider: AsyncMock, dispatcher) -> None:
     """Auto-created session IDs should accumulate history normally."""
-    provider = AsyncMock(spec=LLMProvider)
-
-    async def noop(name: str, args: dict[str, Any]) -> str:
-        return "r"
-
     entity = ChatterboxConversationEntity(
         provider=provider,
-        tool_dispatcher=noop,
+        tool_dispatcher=dispatcher,
         auto_create_conversation_id=True,
     )
-    entity._loop.run = AsyncMock(return_value="Hello")
+    entity._loop.run = _RunStub("Hello")
 
     result = await entity.async_process(ConversationInput(text="Hi"))
     sid = result.conversation_id
@@ -438,28 +432,23 @@ async def test_auto_create_conversation_id_stores_history() -> None:
     assert len(entity._histories[sid]) == 2
 
 
-@pytest.mark.anyio
-async def test_auto_create_disabled_by_default() -> None:
+@pytest.mark.asyncio
+async def test_auto_create_disabled_by_default(entity: ChatterboxConversationEntity) -> None:
     """Default behaviour: no auto ID; None returned when no id provided."""
-    entity = _make_entity("OK")
+    entity._loop.run.return_value = "OK"
     result = await entity.async_process(ConversationInput(text="Hello"))
     assert result.conversation_id is None
 
 
-@pytest.mark.anyio
-async def test_explicit_id_takes_precedence_over_auto_create() -> None:
+@pytest.mark.asyncio
+async def test_explicit_id_takes_precedence_over_auto_create(provider: AsyncMock, dispatcher) -> None:
     """If the caller provides an id, it is used even with auto_create=True."""
-    provider = AsyncMock(spec=LLMProvider)
-
-    async def noop(name: str, args: dict[str, Any]) -> str:
-        return "r"
-
     entity = ChatterboxConversationEntity(
         provider=provider,
-        tool_dispatcher=noop,
+        tool_dispatcher=dispatcher,
         auto_create_conversation_id=True,
     )
-    entity._loop.run = AsyncMock(return_value="Yep")
+    entity._loop.run = _RunStub("Yep")
 
     result = await entity.async_process(
         ConversationInput(text="Hello", conversation_id="explicit-id")
@@ -4,12 +4,13 @@ from __future__ import annotations
 
 import asyncio
 import json
+from functools import lru_cache
 from typing import Any
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock
 
 import pytest
 
-from chatterbox.conversation.loop import AgenticLoop
+from chatterbox.conversation.loop import AgenticLoop, InMemoryLRUCache
 from chatterbox.conversation.providers import (
     CompletionResult,
     ToolCall,
@@ -38,15 +39,20 @@ def _tool_call_result(calls: list[tuple[str, str, dict[str, Any]]]) -> Completio
     Args:
         calls: List of (id, name, arguments) tuples.
     """
-    tool_calls = [ToolCall(id=id_, name=name, arguments=args) for id_, name, args in calls]
-    raw_tc = [
-        {
-            "id": tc.id,
-            "type": "function",
-            "function": {"name": tc.name, "arguments": json.dumps(tc.arguments)},
-        }
-        for tc in tool_calls
-    ]
+    tool_calls: list[ToolCall] = []
+    raw_tc: list[dict[str, Any]] = []
+    for id_, name, args in calls:
+        tool_calls.append(ToolCall(id=id_, name=name, arguments=args))
+        raw_tc.append(
+            {
+                "id": id_,
+                "type": "function",
+                "function": {
+                    "name": name,
+                    "arguments": json.dumps(args, separators=(",", ":")),
+                },
+            }
+        )
     return CompletionResult(
         finish_reason="tool_calls",
         content=None,
@@ -55,17 +61,62 @@ def _tool_call_result(calls: list[tuple[str, str, dict[str, Any]]]) -> Completio
     )
 
 
-def _make_provider(*results: CompletionResult) -> MagicMock:
-    """Return a mock LLMProvider that yields results in sequence."""
-    mock = MagicMock()
-    mock.complete = AsyncMock(side_effect=list(results))
-    return mock
+class FakeProvider:
+    """Lightweight LLMProvider stub yielding canned results in sequence.
+
+    A plain class instead of MagicMock: construction and attribute access
+    are an order of magnitude cheaper, and ``calls`` snapshots the message
+    list at call time (the loop mutates it in place between iterations).
+    Pass no results to repeat the last one indefinitely via ``repeat``.
+    """
+
+    def __init__(self, *results: CompletionResult, repeat: CompletionResult | None = None) -> None:
+        self._results = list(results)
+        self._repeat = repeat
+        self.calls: list[tuple[list[dict[str, Any]], list[ToolDefinition]]] = []
+        # Per-call role index so tests can grab e.g. the tool messages of
+        # the second call without rescanning the whole message list.
+        self.messages_by_role: list[dict[str, list[dict[str, Any]]]] = []
+
+    async def complete(
+        self, messages: list[dict[str, Any]], tools: list[ToolDefinition]
+    ) -> CompletionResult:
+        self.calls.append((list(messages), list(tools)))
+        by_role: dict[str, list[dict[str, Any]]] = {}
+        for m in messages:
+            by_role.setdefault(m.get("role", ""), []).append(m)
+        self.messages_by_role.append(by_role)
+        if self._results:
+            return self._results.pop(0)
+        if self._repeat is not None:
+            return self._repeat
+        raise AssertionError("FakeProvider ran out of canned results")
+
+    @property
+    def call_count(self) -> int:
+        return len(self.calls)
+
+
+def _make_provider(*results: CompletionResult) -> FakeProvider:
+    """Return a stub LLMProvider that yields results in sequence."""
+    return FakeProvider(*results)
 
 
 async def _noop_dispatcher(name: str, args: dict[str, Any]) -> str:
     return f"result_of_{name}"
 
 
+# Shared across tests: the loop never mutates its tools/history arguments
+# or a CompletionResult, so reusing one object per distinct text saves an
+# allocation per test.
+_EMPTY: list[Any] = []
+
+
+@lru_cache(maxsize=32)
+def _cached_stop(text: str) -> CompletionResult:
+    return _stop_result(text)
+
+
 # ---------------------------------------------------------------------------
 # Direct response (no tool calls)
 # ---------------------------------------------------------------------------
@@ -73,35 +124,34 @@ async def _noop_dispatcher(name: str, args: dict[str, Any]) -> str:
 
 @pytest.mark.anyio
 async def test_run_returns_text_on_stop() -> None:
-    provider = _make_provider(_stop_result("Hello, world!"))
+    provider = _make_provider(_cached_stop("Hello, world!"))
     loop = AgenticLoop(provider=provider, tool_dispatcher=_noop_dispatcher)
 
-    result = await loop.run(user_text="Hi", chat_history=[], tools=[])
+    result = await loop.run(user_text="Hi", chat_history=_EMPTY, tools=_EMPTY)
 
     assert result == "Hello, world!"
-    provider.complete.assert_called_once()
+    assert provider.call_count == 1
 
 
 @pytest.mark.anyio
 async def test_run_includes_system_prompt_in_messages() -> None:
-    provider = _make_provider(_stop_result("Done"))
+    provider = _make_provider(_cached_stop("Done"))
     loop = AgenticLoop(
         provider=provider,
         tool_dispatcher=_noop_dispatcher,
         system_prompt="You are helpful.",
     )
 
-    await loop.run(user_text="Test", chat_history=[], tools=[])
+    await loop.run(user_text="Test", chat_history=_EMPTY, tools=_EMPTY)
 
-    call_args = provider.complete.call_args
-    messages = call_args[0][0]
+    messages = provider.calls[-1][0]
     assert messages[0] == {"role": "system", "content": "You are helpful."}
     assert messages[-1] == {"role": "user", "content": "Test"}
 
 
 @pytest.mark.anyio
 async def test_run_includes_chat_history() -> None:
-    provider = _make_provider(_stop_result("Response"))
+    provider = _make_provider(_cached_stop("Response"))
     loop = AgenticLoop(provider=provider, tool_dispatcher=_noop_dispatcher)
 
     history = [
@@ -110,7 +160,7 @@ async def test_run_includes_chat_history() -> None:
     ]
     await loop.run(user_text="New message", chat_history=history, tools=[])
 
-    messages = provider.complete.call_args[0][0]
+    messages = provider.calls[-1][0]
     # history comes before the new user message
     assert messages[-2] == history[-1]
     assert messages[-1] == {"role": "user", "content": "New message"}
@@ -126,21 +176,19 @@ async def test_run_dispatches_single_tool_call() -> None:
     dispatcher = AsyncMock(return_value='{"temp": 72, "conditions": "sunny"}')
     provider = _make_provider(
         _tool_call_result([("call_1", "get_weather", {"location": "Kansas"})]),
-        _stop_result("It is 72°F and sunny in Kansas."),
+        _cached_stop("It is 72°F and sunny in Kansas."),
     )
 
     loop = AgenticLoop(provider=provider, tool_dispatcher=dispatcher)
-    result = await loop.run("What's the weather in Kansas?", chat_history=[], tools=[])
+    result = await loop.run("What's the weather in Kansas?", chat_history=_EMPTY, tools=_EMPTY)
 
     assert result == "It is 72°F and sunny in Kansas."
     dispatcher.assert_called_once_with("get_weather", {"location": "Kansas"})
 
     # Second LLM call must include the tool result message
-    second_call_messages = provider.complete.call_args_list[1][0][0]
-    tool_result_msg = next(
-        (m for m in second_call_messages if m.get("role") == "tool"), None
-    )
-    assert tool_result_msg is not None
+    tool_result_msgs = provider.messages_by_role[1].get("tool", [])
+    assert tool_result_msgs
+    tool_result_msg = tool_result_msgs[0]
     assert tool_result_msg["tool_call_id"] == "call_1"
     assert '{"temp": 72' in tool_result_msg["content"]
 
@@ -156,14 +204,14 @@ async def test_run_handles_multiple_tool_iterations() -> None:
     provider = _make_provider(
         _tool_call_result([("c1", "get_weather", {"location": "LA"})]),
         _tool_call_result([("c2", "get_time", {})]),
-        _stop_result("Weather and time retrieved."),
+        _cached_stop("Weather and time retrieved."),
     )
 
     loop = AgenticLoop(provider=provider, tool_dispatcher=dispatcher, max_iterations=5)
-    result = await loop.run("Weather and time?", [], [])
+    result = await loop.run("Weather and time?", _EMPTY, _EMPTY)
 
     assert result == "Weather and time retrieved."
-    assert provider.complete.call_count == 3
+    assert provider.call_count == 3
     assert dispatcher.call_count == 2
 
 
@@ -181,16 +229,15 @@ async def test_run_handles_tool_dispatcher_exception() -> None:
 
     provider = _make_provider(
         _tool_call_result([("c1", "get_weather", {"location": "X"})]),
-        _stop_result("I could not retrieve weather."),
+        _cached_stop("I could not retrieve weather."),
     )
 
     loop = AgenticLoop(provider=provider, tool_dispatcher=failing_dispatcher)
-    result = await loop.run("Weather?", [], [])
+    result = await loop.run("Weather?", _EMPTY, _EMPTY)
 
     # The loop should not raise; the error is passed back to the LLM as a tool result
     assert result == "I could not retrieve weather."
-    second_call_messages = provider.complete.call_args_list[1][0][0]
-    tool_msg = next(m for m in second_call_messages if m.get("role") == "tool")
+    tool_msg = provider.messages_by_role[1]["tool"][0]
     assert "error" in tool_msg["content"]
     assert "API unavailable" in tool_msg["content"]
 
@@ -204,19 +251,16 @@ async def test_run_handles_tool_dispatcher_exception() -> None:
 async def test_run_raises_on_max_iterations_exceeded() -> None:
     """Loop must raise RuntimeError if LLM never stops calling tools."""
     # Always return a tool call — never stops
-    provider = MagicMock()
-    provider.complete = AsyncMock(
-        return_value=_tool_call_result([("c1", "forever", {})])
-    )
+    provider = FakeProvider(repeat=_tool_call_result([("c1", "forever", {})]))
 
     loop = AgenticLoop(
         provider=provider, tool_dispatcher=_noop_dispatcher, max_iterations=3
     )
 
     with pytest.raises(RuntimeError, match="max_iterations"):
-        await loop.run("Loop forever", [], [])
+        await loop.run("Loop forever", _EMPTY, _EMPTY)
 
-    assert provider.complete.call_count == 3
+    assert provider.call_count == 3
 
 
 # ---------------------------------------------------------------------------
@@ -226,7 +270,7 @@ async def test_run_raises_on_max_iterations_exceeded() -> None:
 
 @pytest.mark.anyio
 async def test_run_passes_tool_definitions_to_provider() -> None:
-    provider = _make_provider(_stop_result("ok"))
+    provider = _make_provider(_cached_stop("ok"))
     loop = AgenticLoop(provider=provider, tool_dispatcher=_noop_dispatcher)
 
     tool = ToolDefinition(
@@ -237,7 +281,7 @@ async def test_run_passes_tool_definitions_to_provider() -> None:
 
     await loop.run("test", [], [tool])
 
-    _, tools_arg = provider.complete.call_args[0]
+    _, tools_arg = provider.calls[-1]
     assert len(tools_arg) == 1
     assert tools_arg[0].name == "get_weather"
 
@@ -250,7 +294,7 @@ async def test_run_passes_tool_definitions_to_provider() -> None:
 @pytest.mark.anyio
 async def test_run_does_not_mutate_chat_history() -> None:
     """The loop must not modify the caller's chat_history list."""
-    provider = _make_provider(_stop_result("Done"))
+    provider = _make_provider(_cached_stop("Done"))
     loop = AgenticLoop(provider=provider, tool_dispatcher=_noop_dispatcher)
 
     history: list[dict[str, Any]] = [{"role": "user", "content": "Previous"}]
@@ -274,7 +318,7 @@ async def test_run_returns_empty_string_for_none_content() -> None:
     )
     loop = AgenticLoop(provider=provider, tool_dispatcher=_noop_dispatcher)
 
-    result = await loop.run("Hi", [], [])
+    result = await loop.run("Hi", _EMPTY, _EMPTY)
 
     assert result == ""
 
@@ -292,7 +336,7 @@ async def test_run_handles_unexpected_finish_reason() -> None:
     )
     loop = AgenticLoop(provider=provider, tool_dispatcher=_noop_dispatcher)
 
-    result = await loop.run("Sensitive query", [], [])
+    result = await loop.run("Sensitive query", _EMPTY, _EMPTY)
 
     assert result == "Filtered response"
 
@@ -310,7 +354,7 @@ async def test_run_handles_tool_calls_finish_reason_with_empty_calls() -> None:
     )
     loop = AgenticLoop(provider=provider, tool_dispatcher=_noop_dispatcher)
 
-    result = await loop.run("Hi", [], [])
+    result = await loop.run("Hi", _EMPTY, _EMPTY)
 
     # Should not call the dispatcher and should return the fallback content
     assert result == "Fallback text"
@@ -325,11 +369,11 @@ async def test_run_dispatches_multiple_tool_calls_in_one_response() -> None:
             ("c1", "get_weather", {"location": "NYC"}),
             ("c2", "get_news", {"topic": "sports"}),
         ]),
-        _stop_result("Here is your weather and news."),
+        _cached_stop("Here is your weather and news."),
     )
 
     loop = AgenticLoop(provider=provider, tool_dispatcher=dispatcher)
-    result = await loop.run("Weather and news?", [], [])
+    result = await loop.run("Weather and news?", _EMPTY, _EMPTY)
 
     assert result == "Here is your weather and news."
     assert dispatcher.call_count == 2
@@ -340,16 +384,16 @@ async def test_run_dispatches_multiple_tool_calls_in_one_response() -> None:
 @pytest.mark.anyio
 async def test_run_without_system_prompt_omits_system_message() -> None:
     """If no system_prompt is set, no system message should be prepended."""
-    provider = _make_provider(_stop_result("ok"))
+    provider = _make_provider(_cached_stop("ok"))
     loop = AgenticLoop(
         provider=provider,
         tool_dispatcher=_noop_dispatcher,
         system_prompt=None,
     )
 
-    await loop.run("Hello", [], [])
+    await loop.run("Hello", _EMPTY, _EMPTY)
 
-    messages = provider.complete.call_args[0][0]
+    messages = provider.calls[-1][0]
     assert not any(m.get("role") == "system" for m in messages)
 
 
@@ -377,10 +421,10 @@ async def test_tool_calls_dispatched_concurrently() -> None:
 
     provider = _make_provider(
         _tool_call_result([("c1", "tool_a", {}), ("c2", "tool_b", {})]),
-        _stop_result("done"),
+        _cached_stop("done"),
     )
     loop = AgenticLoop(provider=provider, tool_dispatcher=tracking_dispatcher)
-    result = await loop.run("query", [], [])
+    result = await loop.run("query", _EMPTY, _EMPTY)
 
     assert result == "done"
     # Both starts must precede both ends — proving concurrent execution
@@ -398,13 +442,167 @@ async def test_concurrent_tool_dispatch_preserves_order() -> None:
             ("id2", "tool_b", {}),
             ("id3", "tool_c", {}),
         ]),
-        _stop_result("ok"),
+        _cached_stop("ok"),
     )
     loop = AgenticLoop(provider=provider, tool_dispatcher=dispatcher)
-    await loop.run("query", [], [])
+    await loop.run("query", _EMPTY, _EMPTY)
 
     # Examine the messages passed to the second LLM call
-    second_call_msgs = provider.complete.call_args_list[1][0][0]
-    tool_msgs = [m for m in second_call_msgs if m.get("role") == "tool"]
+    tool_msgs = provider.messages_by_role[1]["tool"]
     assert [m["tool_call_id"] for m in tool_msgs] == ["id1", "id2", "id3"]
     assert [m["content"] for m in tool_msgs] == ["res_a", "res_b", "res_c"]
+
+
+# ---------------------------------------------------------------------------
+# Response caching
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.anyio
+async def test_response_cache_skips_provider_on_identical_turn() -> None:
+    """With a response cache, an identical turn replays the cached completion."""
+    provider = _make_provider(_cached_stop("cached answer"), _cached_stop("never used"))
+    loop = AgenticLoop(
+        provider=provider,
+        tool_dispatcher=_noop_dispatcher,
+        response_cache=InMemoryLRUCache(),
+    )
+
+    first = await loop.run(user_text="Hi", chat_history=_EMPTY, tools=_EMPTY)
+    second = await loop.run(user_text="Hi", chat_history=_EMPTY, tools=_EMPTY)
+
+    assert first == second == "cached answer"
+    assert provider.call_count == 1
+
+
+@pytest.mark.anyio
+async def test_response_cache_distinguishes_different_inputs() -> None:
+    """Different user text or history must not share cache entries."""
+    provider = _make_provider(_cached_stop("answer one"), _cached_stop("answer two"))
+    loop = AgenticLoop(
+        provider=provider,
+        tool_dispatcher=_noop_dispatcher,
+        response_cache=InMemoryLRUCache(),
+    )
+
+    first = await loop.run(user_text="One", chat_history=_EMPTY, tools=_EMPTY)
+    second = await loop.run(user_text="Two", chat_history=_EMPTY, tools=_EMPTY)
+
+    assert first == "answer one"
+    assert second == "answer two"
+    assert provider.call_count == 2
+
+
+@pytest.mark.anyio
+async def test_cache_tool_results_deduplicates_repeat_calls() -> None:
+    """Identical tool calls across iterations dispatch only once per run."""
+    dispatcher = AsyncMock(return_value='{"temp": 72}')
+    provider = _make_provider(
+        _tool_call_result([("id1", "get_weather", {"location": "Kansas"})]),
+        _tool_call_result([("id2", "get_weather", {"location": "Kansas"})]),
+        _cached_stop("72 degrees"),
+    )
+    loop = AgenticLoop(
+        provider=provider,
+        tool_dispatcher=dispatcher,
+        cache_tool_results=True,
+    )
+
+    result = await loop.run("Weather?", _EMPTY, _EMPTY)
+
+    assert result == "72 degrees"
+    dispatcher.assert_called_once()
+
+
+@pytest.mark.anyio
+async def test_tool_idempotent_predicate_limits_caching() -> None:
+    """Tools the predicate rejects are re-dispatched every time."""
+    dispatcher = AsyncMock(side_effect=["roll: 3", "roll: 5"])
+    provider = _make_provider(
+        _tool_call_result([("id1", "roll_dice", {})]),
+        _tool_call_result([("id2", "roll_dice", {})]),
+        _cached_stop("done"),
+    )
+    loop = AgenticLoop(
+        provider=provider,
+        tool_dispatcher=dispatcher,
+        cache_tool_results=True,
+        tool_idempotent=lambda name: name != "roll_dice",
+    )
+
+    await loop.run("Roll twice", _EMPTY, _EMPTY)
+
+    assert dispatcher.call_count == 2
+
+
+@pytest.mark.anyio
+async def test_max_tool_concurrency_bounds_in_flight_dispatches() -> None:
+    """No more than max_tool_concurrency tools execute at once."""
+    in_flight = 0
+    peak = 0
+
+    async def counting_dispatcher(name: str, args: dict[str, Any]) -> str:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.001)
+        in_flight -= 1
+        return "ok"
+
+    provider = _make_provider(
+        _tool_call_result([(f"id{i}", f"tool_{i}", {}) for i in range(10)]),
+        _cached_stop("done"),
+    )
+    loop = AgenticLoop(
+        provider=provider,
+        tool_dispatcher=counting_dispatcher,
+        max_tool_concurrency=2,
+    )
+
+    result = await loop.run("big batch", _EMPTY, _EMPTY)
+
+    assert result == "done"
+    assert peak <= 2
+
+
+@pytest.mark.anyio
+async def test_tool_handlers_bypass_generic_dispatcher() -> None:
+    """Names in tool_handlers dispatch directly; others use the dispatcher."""
+    handler = AsyncMock(return_value='{"temp": 72}')
+    dispatcher = AsyncMock(return_value="generic_result")
+    provider = _make_provider(
+        _tool_call_result([
+            ("id1", "get_weather", {"location": "Kansas"}),
+            ("id2", "get_time", {}),
+        ]),
+        _cached_stop("done"),
+    )
+    loop = AgenticLoop(
+        provider=provider,
+        tool_dispatcher=dispatcher,
+        tool_handlers={"get_weather": handler},
+    )
+
+    await loop.run("Weather and time?", _EMPTY, _EMPTY)
+
+    handler.assert_called_once_with({"location": "Kansas"})
+    dispatcher.assert_called_once_with("get_time", {})
+
+
+@pytest.mark.anyio
+async def test_encourage_parallel_tools_appends_prompt_nudge() -> None:
+    """The parallel-tools nudge is appended after the configured prompt."""
+    provider = _make_provider(_cached_stop("ok"))
+    loop = AgenticLoop(
+        provider=provider,
+        tool_dispatcher=_noop_dispatcher,
+        system_prompt="You are helpful.",
+        encourage_parallel_tools=True,
+    )
+
+    await loop.run(user_text="Test", chat_history=_EMPTY, tools=_EMPTY)
+
+    system_msg = provider.calls[-1][0][0]
+    assert system_msg["role"] == "system"
+    assert system_msg["content"].startswith("You are helpful.")
+    assert "single response" in system_msg["content"]
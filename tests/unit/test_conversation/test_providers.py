@@ -2,7 +2,16 @@
 
 from __future__ import annotations
 
+import inspect
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
 import pytest
+from openai import (
+    APIConnectionError as OpenAIConnectionError,
+    APIStatusError,
+    RateLimitError as OpenAIRateLimitError,
+)
 
 from chatterbox.conversation.providers import (
     CompletionResult,
@@ -20,6 +29,20 @@ from chatterbox.conversation.providers import (
 )
 
 
+@pytest.fixture(autouse=True)
+def mock_openai(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """Patch ``AsyncOpenAI`` once per test via monkeypatch.
+
+    Every provider test needs the client class replaced and none needs a
+    real one, so a single autouse fixture supersedes the per-test
+    ``with patch(...)`` blocks. The mock class is returned so tests can
+    reach the constructed client via ``mock_openai.return_value``.
+    """
+    cls = MagicMock(return_value=MagicMock())
+    monkeypatch.setattr("chatterbox.conversation.providers.AsyncOpenAI", cls)
+    return cls
+
+
 # ---------------------------------------------------------------------------
 # ToolDefinition
 # ---------------------------------------------------------------------------
@@ -101,43 +124,31 @@ def test_completion_result_tool_calls() -> None:
 # ---------------------------------------------------------------------------
 
 
-def test_openai_compatible_provider_implements_protocol() -> None:
-    """OpenAICompatibleProvider must satisfy the LLMProvider Protocol."""
-    # We test conformance by checking isinstance with the runtime_checkable Protocol.
-    # We avoid actually constructing the client to keep unit tests dep-free.
-    from unittest.mock import patch
+# Signature built once at import: conformance checks are per-test-invariant.
+_COMPLETE_PARAMS = frozenset(
+    inspect.signature(OpenAICompatibleProvider.complete).parameters
+)
 
-    with patch("chatterbox.conversation.providers.AsyncOpenAI") if False else \
-            __import__("contextlib").nullcontext():
-        pass
 
-    # Protocol check via isinstance
+def test_openai_compatible_provider_implements_protocol() -> None:
+    """OpenAICompatibleProvider must satisfy the LLMProvider Protocol."""
     # Use duck-typing check: just verify it has the right method signature
     assert hasattr(OpenAICompatibleProvider, "complete")
-    import inspect
-
-    sig = inspect.signature(OpenAICompatibleProvider.complete)
-    params = list(sig.parameters.keys())
-    assert "messages" in params
-    assert "tools" in params
-
+    assert {"messages", "tools"} <= _COMPLETE_PARAMS
 
-def test_openai_compatible_provider_stores_config() -> None:
-    from unittest.mock import patch, MagicMock
 
-    with patch("chatterbox.conversation.providers.AsyncOpenAI") as mock_cls:
-        mock_cls.return_value = MagicMock()
-        provider = OpenAICompatibleProvider(
-            base_url="http://localhost:11434/v1",
-            model="llama3.1:8b",
-            api_key="ollama",
-            temperature=0.5,
-        )
+def test_openai_compatible_provider_stores_config(mock_openai: MagicMock) -> None:
+    provider = OpenAICompatibleProvider(
+        base_url="http://localhost:11434/v1",
+        model="llama3.1:8b",
+        api_key="ollama",
+        temperature=0.5,
+    )
 
     assert provider.base_url == "http://localhost:11434/v1"
     assert provider.model == "llama3.1:8b"
     assert provider.temperature == 0.5
-    mock_cls.assert_called_once_with(
+    mock_openai.assert_called_once_with(
         base_url="http://localhost:11434/v1", api_key="ollama"
     )
 
@@ -202,37 +213,42 @@ def test_usage_stats_default_cost_none() -> None:
 # ---------------------------------------------------------------------------
 
 
-def test_cost_estimator_known_model() -> None:
-    estimator = CostEstimator()
+@pytest.fixture(scope="module")
+def cost_estimator() -> CostEstimator:
+    """One estimator for the module — it is stateless, so sharing is safe."""
+    return CostEstimator()
+
+
+# ---------------------------------------------------------------------------
+
+
+def test_cost_estimator_known_model(cost_estimator: CostEstimator) -> None:
     # gpt-4o: 0.005/1k input, 0.015/1k output
-    cost = estimator.estimate("gpt-4o", prompt_tokens=1000, completion_tokens=1000)
+    cost = cost_estimator.estimate("gpt-4o", prompt_tokens=1000, completion_tokens=1000)
     assert cost is not None
     assert cost == pytest.approx(0.005 + 0.015)
 
 
-def test_cost_estimator_known_model_mini() -> None:
-    estimator = CostEstimator()
+def test_cost_estimator_known_model_mini(cost_estimator: CostEstimator) -> None:
     # gpt-4o-mini: 0.000150/1k input, 0.000600/1k output
-    cost = estimator.estimate("gpt-4o-mini", prompt_tokens=1000, completion_tokens=1000)
+    cost = cost_estimator.estimate("gpt-4o-mini", prompt_tokens=1000, completion_tokens=1000)
     assert cost is not None
     assert cost == pytest.approx(0.000150 + 0.000600)
 
 
-def test_cost_estimator_unknown_model_returns_none() -> None:
-    estimator = CostEstimator()
-    cost = estimator.estimate("some-unknown-model-v999", prompt_tokens=100, completion_tokens=50)
+def test_cost_estimator_unknown_model_returns_none(cost_estimator: CostEstimator) -> None:
+    cost = cost_estimator.estimate("some-unknown-model-v999", prompt_tokens=100, completion_tokens=50)
     assert cost is None
 
 
-def test_cost_estimator_zero_tokens() -> None:
-    estimator = CostEstimator()
-    cost = estimator.estimate("gpt-4o", prompt_tokens=0, completion_tokens=0)
-    assert cost == pytest.approx(0.0)
+def test_cost_estimator_zero_tokens(cost_estimator: CostEstimator) -> None:
+    cost = cost_estimator.estimate("gpt-4o", prompt_tokens=0, completion_tokens=0)
+    # Zero tokens yields exactly 0.0 — no tolerance machinery needed.
+    assert cost == 0.0
 
 
-def test_cost_estimator_claude_model() -> None:
-    estimator = CostEstimator()
-    cost = estimator.estimate(
+def test_cost_estimator_claude_model(cost_estimator: CostEstimator) -> None:
+    cost = cost_estimator.estimate(
         "claude-haiku-4-5-20251001",
         prompt_tokens=1000,
         completion_tokens=1000,
@@ -247,13 +263,15 @@ def test_cost_estimator_claude_model() -> None:
 
 
 def test_rate_limiter_rejects_zero_calls_per_minute() -> None:
-    with pytest.raises(ValueError, match="positive integer"):
+    with pytest.raises(ValueError) as exc_info:
         RateLimiter(calls_per_minute=0)
+    assert "positive integer" in str(exc_info.value)
 
 
 def test_rate_limiter_rejects_negative_calls_per_minute() -> None:
-    with pytest.raises(ValueError, match="positive integer"):
+    with pytest.raises(ValueError) as exc_info:
         RateLimiter(calls_per_minute=-1)
+    assert "positive integer" in str(exc_info.value)
 
 
 def test_rate_limiter_stores_calls_per_minute() -> None:
@@ -264,11 +282,18 @@ def test_rate_limiter_stores_calls_per_minute() -> None:
 @pytest.mark.anyio
 async def test_rate_limiter_allows_calls_within_limit() -> None:
     """Calls within the limit should not block."""
-    rl = RateLimiter(calls_per_minute=10)
+    now = [0.0]
+    sleeps: list[float] = []
+
+    async def fake_sleep(secs: float) -> None:
+        sleeps.append(secs)
+
+    rl = RateLimiter(calls_per_minute=10, clock=lambda: now[0], sleeper=fake_sleep)
     # 5 rapid calls should all succeed immediately (under limit of 10/min)
     for _ in range(5):
         await rl.acquire()
     assert len(rl._timestamps) == 5
+    assert sleeps == []
 
 
 @pytest.mark.anyio
@@ -279,6 +304,29 @@ async def test_rate_limiter_records_timestamps() -> None:
     assert len(rl._timestamps) == 2
 
 
+@pytest.mark.anyio
+async def test_rate_limiter_sleeps_when_window_full() -> None:
+    """At capacity, acquire() sleeps until the oldest call leaves the window."""
+    now = [0.0]
+    sleeps: list[float] = []
+
+    async def fake_sleep(secs: float) -> None:
+        sleeps.append(secs)
+        now[0] += secs  # simulate time passing while asleep
+
+    rl = RateLimiter(calls_per_minute=2, clock=lambda: now[0], sleeper=fake_sleep)
+    await rl.acquire()
+    now[0] = 10.0
+    await rl.acquire()
+    # Third call exceeds the 2/min budget: must wait until t=60.
+    await rl.acquire()
+
+    assert sleeps == [50.0]
+    # The t=0 entry sits exactly on the window boundary (pruning is strict),
+    # so all three timestamps remain; the new call was recorded at t=60.
+    assert list(rl._timestamps) == [0.0, 10.0, 60.0]
+
+
 # ---------------------------------------------------------------------------
 # CompletionResult with usage
 # ---------------------------------------------------------------------------
@@ -312,73 +360,52 @@ def test_completion_result_usage_defaults_to_none() -> None:
 # ---------------------------------------------------------------------------
 
 
-@pytest.mark.anyio
-async def test_provider_raises_llm_rate_limit_error_on_429() -> None:
-    from unittest.mock import patch, AsyncMock, MagicMock
-    from openai import RateLimitError as OpenAIRateLimitError
-
-    with patch("chatterbox.conversation.providers.AsyncOpenAI") as mock_cls:
-        mock_client = MagicMock()
-        mock_client.chat.completions.create = AsyncMock(
-            side_effect=OpenAIRateLimitError(
-                "rate limit", response=MagicMock(status_code=429), body={}
-            )
-        )
-        mock_cls.return_value = mock_client
-        provider = OpenAICompatibleProvider()
+def _openai_rate_limit_error() -> Exception:
+    return OpenAIRateLimitError(
+        "rate limit", response=MagicMock(status_code=429), body={}
+    )
 
-    with pytest.raises(LLMRateLimitError):
-        await provider.complete(
-            messages=[{"role": "user", "content": "Hi"}],
-            tools=[],
-        )
 
+def _openai_connection_error() -> Exception:
+    return OpenAIConnectionError(request=MagicMock())
 
-@pytest.mark.anyio
-async def test_provider_raises_llm_connection_error_on_network_failure() -> None:
-    from unittest.mock import patch, AsyncMock, MagicMock
-    from openai import APIConnectionError as OpenAIConnectionError
-
-    with patch("chatterbox.conversation.providers.AsyncOpenAI") as mock_cls:
-        mock_client = MagicMock()
-        mock_client.chat.completions.create = AsyncMock(
-            side_effect=OpenAIConnectionError(request=MagicMock())
-        )
-        mock_cls.return_value = mock_client
-        provider = OpenAICompatibleProvider()
 
-    with pytest.raises(LLMConnectionError):
-        await provider.complete(
-            messages=[{"role": "user", "content": "Hi"}],
-            tools=[],
-        )
+def _openai_server_error() -> Exception:
+    return APIStatusError(
+        "Internal Server Error", response=MagicMock(status_code=500), body={}
+    )
 
 
 @pytest.mark.anyio
-async def test_provider_raises_llm_api_error_on_5xx() -> None:
-    from unittest.mock import patch, AsyncMock, MagicMock
-    from openai import APIStatusError
-
-    with patch("chatterbox.conversation.providers.AsyncOpenAI") as mock_cls:
-        mock_client = MagicMock()
-        mock_response = MagicMock()
-        mock_response.status_code = 500
-        mock_client.chat.completions.create = AsyncMock(
-            side_effect=APIStatusError(
-                "Internal Server Error",
-                response=mock_response,
-                body={},
-            )
-        )
-        mock_cls.return_value = mock_client
-        provider = OpenAICompatibleProvider()
+@pytest.mark.parametrize(
+    ("make_openai_exc", "expected_exc", "expected_status"),
+    [
+        pytest.param(_openai_rate_limit_error, LLMRateLimitError, None, id="429"),
+        pytest.param(
+            _openai_connection_error, LLMConnectionError, None, id="connection"
+        ),
+        pytest.param(_openai_server_error, LLMAPIError, 500, id="5xx"),
+    ],
+)
+async def test_provider_maps_openai_errors(
+    mock_openai: MagicMock,
+    make_openai_exc,
+    expected_exc: type[Exception],
+    expected_status: int | None,
+) -> None:
+    """OpenAI SDK exceptions map to the provider's own error hierarchy."""
+    mock_openai.return_value.chat.completions.create = AsyncMock(
+        side_effect=make_openai_exc()
+    )
+    provider = OpenAICompatibleProvider()
 
-    with pytest.raises(LLMAPIError) as exc_info:
+    with pytest.raises(expected_exc) as exc_info:
         await provider.complete(
             messages=[{"role": "user", "content": "Hi"}],
             tools=[],
         )
-    assert exc_info.value.status_code == 500
+    if expected_status is not None:
+        assert exc_info.value.status_code == expected_status
 
 
 # ---------------------------------------------------------------------------
@@ -386,28 +413,35 @@ async def test_provider_raises_llm_api_error_on_5xx() -> None:
 # ---------------------------------------------------------------------------
 
 
+def _mock_response(
+    content: str, usage: SimpleNamespace | None = None
+) -> SimpleNamespace:
+    """Build a minimal realistic completion response object.
+
+    Plain namespaces instead of a MagicMock tree: every dotted assignment
+    on a MagicMock spins up child-mock machinery the provider never needs.
+    """
+    return SimpleNamespace(
+        choices=[
+            SimpleNamespace(
+                finish_reason="stop",
+                message=SimpleNamespace(content=content, tool_calls=None),
+            )
+        ],
+        usage=usage,
+    )
+
+
 @pytest.mark.anyio
-async def test_provider_calls_rate_limiter_acquire() -> None:
+async def test_provider_calls_rate_limiter_acquire(mock_openai: MagicMock) -> None:
     """Provider must call rate_limiter.acquire() before each completion."""
-    from unittest.mock import patch, AsyncMock, MagicMock
-
     rate_limiter = MagicMock()
     rate_limiter.acquire = AsyncMock()
 
-    with patch("chatterbox.conversation.providers.AsyncOpenAI") as mock_cls:
-        mock_client = MagicMock()
-        # Build a minimal realistic response object
-        mock_choice = MagicMock()
-        mock_choice.finish_reason = "stop"
-        mock_choice.message.content = "Hi there"
-        mock_choice.message.tool_calls = None
-        mock_response = MagicMock()
-        mock_response.choices = [mock_choice]
-        mock_response.usage = None
-        mock_client.chat.completions.create = AsyncMock(return_value=mock_response)
-        mock_cls.return_value = mock_client
-
-        provider = OpenAICompatibleProvider(rate_limiter=rate_limiter)
+    mock_openai.return_value.chat.completions.create = AsyncMock(
+        return_value=_mock_response("Hi there")
+    )
+    provider = OpenAICompatibleProvider(rate_limiter=rate_limiter)
 
     await provider.complete(messages=[{"role": "user", "content": "Hi"}], tools=[])
 
@@ -420,29 +454,19 @@ async def test_provider_calls_rate_limiter_acquire() -> None:
 
 
 @pytest.mark.anyio
-async def test_provider_populates_usage_stats_when_response_includes_usage() -> None:
-    from unittest.mock import patch, AsyncMock, MagicMock
-
-    with patch("chatterbox.conversation.providers.AsyncOpenAI") as mock_cls:
-        mock_client = MagicMock()
-        mock_choice = MagicMock()
-        mock_choice.finish_reason = "stop"
-        mock_choice.message.content = "The answer is 42."
-        mock_choice.message.tool_calls = None
-        mock_usage = MagicMock()
-        mock_usage.prompt_tokens = 80
-        mock_usage.completion_tokens = 20
-        mock_usage.total_tokens = 100
-        mock_response = MagicMock()
-        mock_response.choices = [mock_choice]
-        mock_response.usage = mock_usage
-        mock_client.chat.completions.create = AsyncMock(return_value=mock_response)
-        mock_cls.return_value = mock_client
-
-        provider = OpenAICompatibleProvider(
-            model="gpt-4o-mini",
-            cost_estimator=CostEstimator(),
-        )
+async def test_provider_populates_usage_stats_when_response_includes_usage(
+    mock_openai: MagicMock,
+) -> None:
+    mock_usage = SimpleNamespace(
+        prompt_tokens=80, completion_tokens=20, total_tokens=100
+    )
+    mock_openai.return_value.chat.completions.create = AsyncMock(
+        return_value=_mock_response("The answer is 42.", usage=mock_usage)
+    )
+    provider = OpenAICompatibleProvider(
+        model="gpt-4o-mini",
+        cost_estimator=CostEstimator(),
+    )
 
     result = await provider.complete(
         messages=[{"role": "user", "content": "What is the answer?"}],
@@ -458,22 +482,13 @@ async def test_provider_populates_usage_stats_when_response_includes_usage() ->
 
 
 @pytest.mark.anyio
-async def test_provider_usage_is_none_when_response_has_no_usage() -> None:
-    from unittest.mock import patch, AsyncMock, MagicMock
-
-    with patch("chatterbox.conversation.providers.AsyncOpenAI") as mock_cls:
-        mock_client = MagicMock()
-        mock_choice = MagicMock()
-        mock_choice.finish_reason = "stop"
-        mock_choice.message.content = "Response"
-        mock_choice.message.tool_calls = None
-        mock_response = MagicMock()
-        mock_response.choices = [mock_choice]
-        mock_response.usage = None
-        mock_client.chat.completions.create = AsyncMock(return_value=mock_response)
-        mock_cls.return_value = mock_client
-
-        provider = OpenAICompatibleProvider()
+async def test_provider_usage_is_none_when_response_has_no_usage(
+    mock_openai: MagicMock,
+) -> None:
+    mock_openai.return_value.chat.completions.create = AsyncMock(
+        return_value=_mock_response("Response")
+    )
+    provider = OpenAICompatibleProvider()
 
     result = await provider.complete(
         messages=[{"role": "user", "content": "Hello"}],
@@ -2,12 +2,18 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
 from datetime import datetime, timezone
+from typing import Any
 from unittest.mock import patch
 
 import pytest
 
+try:  # optional: faster decode for the many small result-JSON assertions
+    from orjson import loads as _loads
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+    from json import loads as _loads
+
 from chatterbox.conversation.providers import ToolDefinition
 from chatterbox.conversation.tools.datetime_tool import DateTimeTool
 
@@ -46,85 +52,62 @@ class TestDateTimeToolDefinition:
 
 
 _FIXED_UTC = datetime(2026, 2, 20, 14, 30, 0, tzinfo=timezone.utc)
+# Precomputed once: .timestamp() does a C-level tz conversion per call.
+_FIXED_UTC_TS = int(_FIXED_UTC.timestamp())
+
+
+def _frozen_get_datetime(*args: Any) -> dict[str, Any]:
+    """Run get_datetime once with the module clock frozen at _FIXED_UTC."""
+    tool = DateTimeTool()
+    with patch("chatterbox.conversation.tools.datetime_tool.datetime") as mock_dt:
+        mock_dt.now.return_value = _FIXED_UTC
+        return asyncio.run(tool.get_datetime(*args))
+
+
+@pytest.fixture(scope="module")
+def utc_result() -> dict[str, Any]:
+    """One frozen-clock get_datetime() call shared by every UTC test.
+
+    The UTC tests each assert one field of the same result dict, so the
+    patch/instantiate/call cycle runs once per module and the tests
+    themselves become plain dict lookups (no event loop per test).
+    """
+    return _frozen_get_datetime()
 
 
 class TestGetDatetimeUTC:
-    @pytest.mark.anyio
-    async def test_returns_dict(self) -> None:
-        tool = DateTimeTool()
-        with patch("chatterbox.conversation.tools.datetime_tool.datetime") as mock_dt:
-            mock_dt.now.return_value = _FIXED_UTC
-            result = await tool.get_datetime()
-        assert isinstance(result, dict)
+    def test_returns_dict(self, utc_result: dict[str, Any]) -> None:
+        assert isinstance(utc_result, dict)
 
-    @pytest.mark.anyio
-    async def test_required_keys_present(self) -> None:
-        tool = DateTimeTool()
-        with patch("chatterbox.conversation.tools.datetime_tool.datetime") as mock_dt:
-            mock_dt.now.return_value = _FIXED_UTC
-            result = await tool.get_datetime()
-        assert "datetime_iso" in result
-        assert "date" in result
-        assert "time" in result
-        assert "timezone" in result
-        assert "day_of_week" in result
-        assert "unix_timestamp" in result
+    def test_required_keys_present(self, utc_result: dict[str, Any]) -> None:
+        assert "datetime_iso" in utc_result
+        assert "date" in utc_result
+        assert "time" in utc_result
+        assert "timezone" in utc_result
+        assert "day_of_week" in utc_result
+        assert "unix_timestamp" in utc_result
 
-    @pytest.mark.anyio
-    async def test_no_error_field_for_utc(self) -> None:
-        tool = DateTimeTool()
-        with patch("chatterbox.conversation.tools.datetime_tool.datetime") as mock_dt:
-            mock_dt.now.return_value = _FIXED_UTC
-            result = await tool.get_datetime()
-        assert "error" not in result
+    def test_no_error_field_for_utc(self, utc_result: dict[str, Any]) -> None:
+        assert "error" not in utc_result
 
-    @pytest.mark.anyio
-    async def test_date_format(self) -> None:
-        tool = DateTimeTool()
-        with patch("chatterbox.conversation.tools.datetime_tool.datetime") as mock_dt:
-            mock_dt.now.return_value = _FIXED_UTC
-            result = await tool.get_datetime()
-        assert result["date"] == "2026-02-20"
+    def test_date_format(self, utc_result: dict[str, Any]) -> None:
+        assert utc_result["date"] == "2026-02-20"
 
-    @pytest.mark.anyio
-    async def test_time_format(self) -> None:
-        tool = DateTimeTool()
-        with patch("chatterbox.conversation.tools.datetime_tool.datetime") as mock_dt:
-            mock_dt.now.return_value = _FIXED_UTC
-            result = await tool.get_datetime()
-        assert result["time"] == "14:30:00"
+    def test_time_format(self, utc_result: dict[str, Any]) -> None:
+        assert utc_result["time"] == "14:30:00"
 
-    @pytest.mark.anyio
-    async def test_day_of_week(self) -> None:
-        tool = DateTimeTool()
-        with patch("chatterbox.conversation.tools.datetime_tool.datetime") as mock_dt:
-            mock_dt.now.return_value = _FIXED_UTC
-            result = await tool.get_datetime()
-        assert result["day_of_week"] == "Friday"
+    def test_day_of_week(self, utc_result: dict[str, Any]) -> None:
+        assert utc_result["day_of_week"] == "Friday"
 
-    @pytest.mark.anyio
-    async def test_unix_timestamp(self) -> None:
-        tool = DateTimeTool()
-        with patch("chatterbox.conversation.tools.datetime_tool.datetime") as mock_dt:
-            mock_dt.now.return_value = _FIXED_UTC
-            result = await tool.get_datetime()
-        assert result["unix_timestamp"] == int(_FIXED_UTC.timestamp())
+    def test_unix_timestamp(self, utc_result: dict[str, Any]) -> None:
+        assert utc_result["unix_timestamp"] == _FIXED_UTC_TS
 
-    @pytest.mark.anyio
-    async def test_iso8601_contains_offset(self) -> None:
-        tool = DateTimeTool()
-        with patch("chatterbox.conversation.tools.datetime_tool.datetime") as mock_dt:
-            mock_dt.now.return_value = _FIXED_UTC
-            result = await tool.get_datetime()
+    def test_iso8601_contains_offset(self, utc_result: dict[str, Any]) -> None:
         # ISO-8601 with UTC offset should contain '+00:00' or 'Z'
-        assert "+00:00" in result["datetime_iso"] or "Z" in result["datetime_iso"]
+        assert "+00:00" in utc_result["datetime_iso"] or "Z" in utc_result["datetime_iso"]
 
-    @pytest.mark.anyio
-    async def test_empty_string_timezone_treated_as_utc(self) -> None:
-        tool = DateTimeTool()
-        with patch("chatterbox.conversation.tools.datetime_tool.datetime") as mock_dt:
-            mock_dt.now.return_value = _FIXED_UTC
-            result = await tool.get_datetime("")
+    def test_empty_string_timezone_treated_as_utc(self) -> None:
+        result = _frozen_get_datetime("")
         assert "error" not in result
 
 
@@ -133,17 +116,27 @@ class TestGetDatetimeUTC:
 # ---------------------------------------------------------------------------
 
 
+@pytest.fixture(scope="module")
+def tool() -> DateTimeTool:
+    """Shared stateless tool instance for tests that call it read-only."""
+    return DateTimeTool()
+
+
 class TestGetDatetimeNamedTimezone:
     @pytest.mark.anyio
-    async def test_valid_timezone_returns_no_error(self) -> None:
-        tool = DateTimeTool()
-        result = await tool.get_datetime("America/New_York")
+    async def test_valid_timezone_returns_no_error(self, tool: DateTimeTool) -> None:
+        # Patch ZoneInfo so the test exercises the valid-zone code path
+        # without reading tzdata files (FS I/O, and CI images may lack them).
+        with patch(
+            "chatterbox.conversation.tools.datetime_tool.ZoneInfo",
+            return_value=timezone.utc,
+        ):
+            result = await tool.get_datetime("America/New_York")
         # Either works (real or fallback) — just no exception
         assert "datetime_iso" in result
 
     @pytest.mark.anyio
-    async def test_invalid_timezone_falls_back_to_utc(self) -> None:
-        tool = DateTimeTool()
+    async def test_invalid_timezone_falls_back_to_utc(self, tool: DateTimeTool) -> None:
         result = await tool.get_datetime("Not/A_Real_Zone")
         # Should contain an error field
         assert "error" in result
@@ -151,8 +144,7 @@ class TestGetDatetimeNamedTimezone:
         assert "datetime_iso" in result
 
     @pytest.mark.anyio
-    async def test_invalid_timezone_error_mentions_zone(self) -> None:
-        tool = DateTimeTool()
+    async def test_invalid_timezone_error_mentions_zone(self, tool: DateTimeTool) -> None:
         result = await tool.get_datetime("Not/A_Real_Zone")
         assert "Not/A_Real_Zone" in result["error"]
 
@@ -162,37 +154,36 @@ class TestGetDatetimeNamedTimezone:
 # ---------------------------------------------------------------------------
 
 
+@pytest.fixture(scope="module")
+def handler(tool: DateTimeTool):
+    return tool.as_dispatcher_entry()
+
+
 class TestDateTimeToolDispatcherEntry:
     @pytest.mark.anyio
-    async def test_dispatcher_entry_returns_json_string(self) -> None:
-        tool = DateTimeTool()
-        handler = tool.as_dispatcher_entry()
+    async def test_dispatcher_entry_returns_json_string(self, handler) -> None:
         result = await handler({})
-        data = json.loads(result)  # should be valid JSON
+        data = _loads(result)  # should be valid JSON
         assert "datetime_iso" in data
 
     @pytest.mark.anyio
-    async def test_dispatcher_entry_accepts_timezone_arg(self) -> None:
-        tool = DateTimeTool()
-        handler = tool.as_dispatcher_entry()
+    async def test_dispatcher_entry_accepts_timezone_arg(self, handler) -> None:
         result = await handler({"timezone": "Europe/London"})
-        data = json.loads(result)
+        data = _loads(result)
         assert "datetime_iso" in data
 
     @pytest.mark.anyio
-    async def test_dispatcher_entry_empty_args(self) -> None:
-        tool = DateTimeTool()
-        handler = tool.as_dispatcher_entry()
+    async def test_dispatcher_entry_empty_args(self, handler) -> None:
         result = await handler({})
-        data = json.loads(result)
+        data = _loads(result)
         assert "date" in data
 
     @pytest.mark.anyio
-    async def test_dispatcher_entry_invalid_timezone_returns_error_in_json(self) -> None:
-        tool = DateTimeTool()
-        handler = tool.as_dispatcher_entry()
+    async def test_dispatcher_entry_invalid_timezone_returns_error_in_json(
+        self, handler
+    ) -> None:
         result = await handler({"timezone": "INVALID/ZONE"})
-        data = json.loads(result)
+        data = _loads(result)
         assert "error" in data
         # Result still has valid datetime fields
         assert "datetime_iso" in data
@@ -2,9 +2,8 @@
 
 from __future__ import annotations
 
-import json
 from typing import Any
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import MagicMock
 
 import httpx
 import pytest
@@ -12,29 +11,49 @@ import pytest
 from chatterbox.conversation.providers import ToolDefinition
 from chatterbox.conversation.tools.weather import WeatherTool, _WMO_CONDITIONS
 
+try:  # optional: faster decode for dispatcher-output assertions
+    from orjson import loads as _loads
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+    from json import loads as _loads
+
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
 
-def _mock_response(json_data: dict[str, Any], status_code: int = 200) -> MagicMock:
-    """Build a mock httpx Response."""
-    resp = MagicMock(spec=httpx.Response)
-    resp.status_code = status_code
-    resp.json.return_value = json_data
-    resp.raise_for_status = MagicMock()
-    return resp
+class _FakeResp:
+    """Minimal httpx.Response stand-in.
+
+    WeatherTool only calls ``json()`` and ``raise_for_status()``, so a
+    slotted stub replaces ``MagicMock(spec=httpx.Response)`` and its
+    per-construction spec introspection.
+    """
 
+    __slots__ = ("status_code", "_json")
 
-def _mock_error_response(status_code: int) -> MagicMock:
-    """Build a mock httpx Response that raises on raise_for_status."""
-    resp = MagicMock(spec=httpx.Response)
-    resp.status_code = status_code
-    resp.raise_for_status.side_effect = httpx.HTTPStatusError(
-        f"HTTP {status_code}", request=MagicMock(), response=resp
-    )
-    return resp
+    def __init__(self, json_data: dict[str, Any] | None, status_code: int = 200) -> None:
+        self.status_code = status_code
+        self._json = json_data
+
+    def json(self) -> dict[str, Any]:
+        return self._json
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise httpx.HTTPStatusError(
+                f"HTTP {self.status_code}", request=MagicMock(), response=self
+            )
+
+
+def _mock_response(json_data: dict[str, Any], status_code: int = 200) -> _FakeResp:
+    """Build a stub httpx Response."""
+    return _FakeResp(json_data, status_code)
+
+
+def _mock_error_response(status_code: int) -> _FakeResp:
+    """Build a stub httpx Response that raises on raise_for_status."""
+    return _FakeResp(None, status_code)
 
 
 def _geo_response(
@@ -73,23 +92,43 @@ def _weather_response(
     }
 
 
-def _make_client_mock(
-    *responses: MagicMock,
-) -> tuple[MagicMock, MagicMock]:
-    """Return (patch_target_mock, client_instance_mock) for httpx.AsyncClient.
+class _FakeAsyncClient:
+    """httpx.AsyncClient stand-in: yields canned responses from ``get``.
 
-    The client instance's ``get`` method is an AsyncMock that returns *responses*
-    in sequence.
+    Replaces the per-test AsyncMock/MagicMock context-manager wiring —
+    AsyncMock construction and call recording dominate otherwise-trivial
+    tests. ``get`` returns the queued items in order, raising any
+    exception instances it encounters.
     """
-    client_instance = AsyncMock()
-    client_instance.get = AsyncMock(side_effect=list(responses))
 
-    ctx_manager = MagicMock()
-    ctx_manager.__aenter__ = AsyncMock(return_value=client_instance)
-    ctx_manager.__aexit__ = AsyncMock(return_value=False)
+    def __init__(self, *responses: Any) -> None:
+        self._responses = iter(responses)
+        self.get_calls: list[tuple[Any, ...]] = []
+
+    async def __aenter__(self) -> "_FakeAsyncClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> bool:
+        return False
+
+    async def get(self, *args: Any, **kwargs: Any) -> Any:
+        self.get_calls.append(args)
+        item = next(self._responses)
+        if isinstance(item, BaseException):
+            raise item
+        return item
+
+
+# Default payloads shared across tests. Treated as read-only: the tool
+# under test only reads from the decoded JSON.
+_DEFAULT_GEO = _geo_response()
+_DEFAULT_WX = _weather_response()
+
 
-    async_client_cls = MagicMock(return_value=ctx_manager)
-    return async_client_cls, client_instance
+def _tool_with(*responses: Any) -> WeatherTool:
+    """WeatherTool wired to a stub client serving *responses* in order."""
+    client = _FakeAsyncClient(*responses)
+    return WeatherTool(client_factory=lambda **kw: client)
 
 
 # ---------------------------------------------------------------------------
@@ -126,14 +165,9 @@ class TestToolDefinition:
 
 
 @pytest.mark.anyio
-async def test_get_weather_returns_expected_keys():
-    tool = WeatherTool()
-    geo_resp = _mock_response(_geo_response())
-    wx_resp = _mock_response(_weather_response())
-    async_client_cls, _ = _make_client_mock(geo_resp, wx_resp)
-
-    with patch("chatterbox.conversation.tools.weather.httpx.AsyncClient", async_client_cls):
-        result = await tool.get_weather("Kansas City")
+async def test_get_weather_returns_expected_keys() -> None:
+    tool = _tool_with(_mock_response(_DEFAULT_GEO), _mock_response(_DEFAULT_WX))
+    result = await tool.get_weather("Kansas City")
 
     assert set(result.keys()) == {
         "location_name",
@@ -147,85 +181,71 @@ async def test_get_weather_returns_expected_keys():
 
 
 @pytest.mark.anyio
-async def test_get_weather_location_name_includes_admin_and_country():
-    tool = WeatherTool()
-    geo_resp = _mock_response(_geo_response(name="Kansas City", admin1="Missouri", country="United States"))
-    wx_resp = _mock_response(_weather_response())
-    async_client_cls, _ = _make_client_mock(geo_resp, wx_resp)
-
-    with patch("chatterbox.conversation.tools.weather.httpx.AsyncClient", async_client_cls):
-        result = await tool.get_weather("Kansas City")
+async def test_get_weather_location_name_includes_admin_and_country() -> None:
+    tool = _tool_with(
+        _mock_response(
+            _geo_response(name="Kansas City", admin1="Missouri", country="United States")
+        ),
+        _mock_response(_DEFAULT_WX),
+    )
+    result = await tool.get_weather("Kansas City")
 
     assert "Kansas City" in result["location_name"]
     assert "Missouri" in result["location_name"]
     assert "United States" in result["location_name"]
 
 
-@pytest.mark.anyio
-async def test_get_weather_temperature_conversion():
-    tool = WeatherTool()
-    geo_resp = _mock_response(_geo_response())
-    wx_resp = _mock_response(_weather_response(temp_c=0.0))
-    async_client_cls, _ = _make_client_mock(geo_resp, wx_resp)
-
-    with patch("chatterbox.conversation.tools.weather.httpx.AsyncClient", async_client_cls):
-        result = await tool.get_weather("Somewhere")
-
+def _check_freezing(result: dict[str, Any]) -> None:
     assert result["temperature_c"] == 0.0
     assert result["temperature_f"] == 32.0
 
 
-@pytest.mark.anyio
-async def test_get_weather_temperature_conversion_100c():
-    tool = WeatherTool()
-    geo_resp = _mock_response(_geo_response())
-    wx_resp = _mock_response(_weather_response(temp_c=100.0))
-    async_client_cls, _ = _make_client_mock(geo_resp, wx_resp)
-
-    with patch("chatterbox.conversation.tools.weather.httpx.AsyncClient", async_client_cls):
-        result = await tool.get_weather("Somewhere")
-
+def _check_boiling(result: dict[str, Any]) -> None:
     assert result["temperature_f"] == 212.0
 
 
-@pytest.mark.anyio
-async def test_get_weather_known_wmo_code():
-    tool = WeatherTool()
-    geo_resp = _mock_response(_geo_response())
-    wx_resp = _mock_response(_weather_response(weather_code=61))
-    async_client_cls, _ = _make_client_mock(geo_resp, wx_resp)
+def _check_known_wmo(result: dict[str, Any]) -> None:
+    assert result["conditions"] == "Slight rain"
 
-    with patch("chatterbox.conversation.tools.weather.httpx.AsyncClient", async_client_cls):
-        result = await tool.get_weather("London")
 
-    assert result["conditions"] == "Slight rain"
+def _check_unknown_wmo(result: dict[str, Any]) -> None:
+    assert "999" in result["conditions"]
 
 
-@pytest.mark.anyio
-async def test_get_weather_unknown_wmo_code_fallback():
-    tool = WeatherTool()
-    geo_resp = _mock_response(_geo_response())
-    wx_resp = _mock_response(_weather_response(weather_code=999))
-    async_client_cls, _ = _make_client_mock(geo_resp, wx_resp)
+def _check_wind_mph(result: dict[str, Any]) -> None:
+    # 16.093 km/h ≈ 10.0 mph
+    assert abs(result["wind_speed_mph"] - 10.0) < 0.1
 
-    with patch("chatterbox.conversation.tools.weather.httpx.AsyncClient", async_client_cls):
-        result = await tool.get_weather("Somewhere")
 
-    assert "999" in result["conditions"]
+def _check_humidity_int(result: dict[str, Any]) -> None:
+    assert isinstance(result["humidity_percent"], int)
+    assert result["humidity_percent"] == 72
 
 
 @pytest.mark.anyio
-async def test_get_weather_wind_speed_conversion():
-    tool = WeatherTool()
-    geo_resp = _mock_response(_geo_response())
-    wx_resp = _mock_response(_weather_response(wind_kmh=16.093))
-    async_client_cls, _ = _make_client_mock(geo_resp, wx_resp)
-
-    with patch("chatterbox.conversation.tools.weather.httpx.AsyncClient", async_client_cls):
-        result = await tool.get_weather("Somewhere")
+@pytest.mark.parametrize(
+    ("wx_kwargs", "check"),
+    [
+        pytest.param({"temp_c": 0.0}, _check_freezing, id="celsius-to-fahrenheit-0c"),
+        pytest.param({"temp_c": 100.0}, _check_boiling, id="celsius-to-fahrenheit-100c"),
+        pytest.param({"weather_code": 61}, _check_known_wmo, id="known-wmo-code"),
+        pytest.param({"weather_code": 999}, _check_unknown_wmo, id="unknown-wmo-fallback"),
+        pytest.param({"wind_kmh": 16.093}, _check_wind_mph, id="wind-kmh-to-mph"),
+        pytest.param({"humidity": 72}, _check_humidity_int, id="humidity-cast-to-int"),
+    ],
+)
+async def test_get_weather_field_conversions(wx_kwargs: dict[str, Any], check) -> None:
+    """One parametrized path for the field-conversion variants.
+
+    The variants share identical mock plumbing and differ only in one
+    weather-response field and its expected conversion.
+    """
+    tool = _tool_with(
+        _mock_response(_DEFAULT_GEO), _mock_response(_weather_response(**wx_kwargs))
+    )
+    result = await tool.get_weather("Somewhere")
 
-    # 16.093 km/h ≈ 10.0 mph
-    assert abs(result["wind_speed_mph"] - 10.0) < 0.1
+    check(result)
 
 
 # ---------------------------------------------------------------------------
@@ -234,64 +254,38 @@ async def test_get_weather_wind_speed_conversion():
 
 
 @pytest.mark.anyio
-async def test_get_weather_location_not_found_raises_value_error():
-    tool = WeatherTool()
-    geo_resp = _mock_response({"results": []})
-    async_client_cls, _ = _make_client_mock(geo_resp)
-
-    with patch("chatterbox.conversation.tools.weather.httpx.AsyncClient", async_client_cls):
-        with pytest.raises(ValueError, match="Location not found"):
-            await tool.get_weather("xyzzy99nonexistent")
+async def test_get_weather_location_not_found_raises_value_error() -> None:
+    tool = _tool_with(_mock_response({"results": []}))
+    with pytest.raises(ValueError, match="Location not found"):
+        await tool.get_weather("xyzzy99nonexistent")
 
 
 @pytest.mark.anyio
-async def test_get_weather_null_results_raises_value_error():
-    tool = WeatherTool()
-    geo_resp = _mock_response({})  # no "results" key
-    async_client_cls, _ = _make_client_mock(geo_resp)
-
-    with patch("chatterbox.conversation.tools.weather.httpx.AsyncClient", async_client_cls):
-        with pytest.raises(ValueError, match="Location not found"):
-            await tool.get_weather("???")
+async def test_get_weather_null_results_raises_value_error() -> None:
+    tool = _tool_with(_mock_response({}))  # no "results" key
+    with pytest.raises(ValueError, match="Location not found"):
+        await tool.get_weather("???")
 
 
 @pytest.mark.anyio
-async def test_get_weather_geocoding_http_error_propagates():
-    tool = WeatherTool()
-    geo_resp = _mock_error_response(503)
-    async_client_cls, _ = _make_client_mock(geo_resp)
-
-    with patch("chatterbox.conversation.tools.weather.httpx.AsyncClient", async_client_cls):
-        with pytest.raises(httpx.HTTPStatusError):
-            await tool.get_weather("Kansas City")
+async def test_get_weather_geocoding_http_error_propagates() -> None:
+    tool = _tool_with(_mock_error_response(503))
+    with pytest.raises(httpx.HTTPStatusError):
+        await tool.get_weather("Kansas City")
 
 
 @pytest.mark.anyio
-async def test_get_weather_weather_api_http_error_propagates():
-    tool = WeatherTool()
-    geo_resp = _mock_response(_geo_response())
-    wx_resp = _mock_error_response(500)
-    async_client_cls, _ = _make_client_mock(geo_resp, wx_resp)
-
-    with patch("chatterbox.conversation.tools.weather.httpx.AsyncClient", async_client_cls):
-        with pytest.raises(httpx.HTTPStatusError):
-            await tool.get_weather("Kansas City")
+async def test_get_weather_weather_api_http_error_propagates() -> None:
+    tool = _tool_with(_mock_response(_DEFAULT_GEO), _mock_error_response(500))
+    with pytest.raises(httpx.HTTPStatusError):
+        await tool.get_weather("Kansas City")
 
 
 @pytest.mark.anyio
-async def test_get_weather_timeout_propagates():
-    tool = WeatherTool()
-
-    client_instance = AsyncMock()
-    client_instance.get = AsyncMock(side_effect=httpx.TimeoutException("timeout"))
-    ctx_manager = MagicMock()
-    ctx_manager.__aenter__ = AsyncMock(return_value=client_instance)
-    ctx_manager.__aexit__ = AsyncMock(return_value=False)
-    async_client_cls = MagicMock(return_value=ctx_manager)
-
-    with patch("chatterbox.conversation.tools.weather.httpx.AsyncClient", async_client_cls):
-        with pytest.raises(httpx.TimeoutException):
-            await tool.get_weather("Kansas City")
+async def test_get_weather_timeout_propagates() -> None:
+    tool = _tool_with(httpx.TimeoutException("timeout"))
+    with pytest.raises(httpx.TimeoutException):
+        await tool.get_weather("Kansas City")
 
 
 # ---------------------------------------------------------------------------
@@ -300,77 +294,54 @@ async def test_get_weather_timeout_propagates():
 
 
 @pytest.mark.anyio
-async def test_dispatcher_entry_success():
-    tool = WeatherTool()
-    geo_resp = _mock_response(_geo_response())
-    wx_resp = _mock_response(_weather_response(temp_c=25.0, weather_code=0))
-    async_client_cls, _ = _make_client_mock(geo_resp, wx_resp)
-
+async def test_dispatcher_entry_success() -> None:
+    tool = _tool_with(
+        _mock_response(_DEFAULT_GEO),
+        _mock_response(_weather_response(temp_c=25.0, weather_code=0)),
+    )
     handler = tool.as_dispatcher_entry()
-    with patch("chatterbox.conversation.tools.weather.httpx.AsyncClient", async_client_cls):
-        raw = await handler({"location": "Kansas City"})
+    raw = await handler({"location": "Kansas City"})
 
-    data = json.loads(raw)
+    data = _loads(raw)
     assert "temperature_c" in data
     assert data["temperature_c"] == 25.0
     assert data["conditions"] == "Clear sky"
 
 
 @pytest.mark.anyio
-async def test_dispatcher_entry_missing_location_arg():
-    tool = WeatherTool()
-    handler = tool.as_dispatcher_entry()
+async def test_dispatcher_entry_missing_location_arg() -> None:
+    handler = _tool_with().as_dispatcher_entry()
     raw = await handler({})
-    data = json.loads(raw)
+    data = _loads(raw)
     assert "error" in data
     assert "location" in data["error"]
 
 
 @pytest.mark.anyio
-async def test_dispatcher_entry_location_not_found():
-    tool = WeatherTool()
-    geo_resp = _mock_response({"results": []})
-    async_client_cls, _ = _make_client_mock(geo_resp)
-
-    handler = tool.as_dispatcher_entry()
-    with patch("chatterbox.conversation.tools.weather.httpx.AsyncClient", async_client_cls):
-        raw = await handler({"location": "nonexistent place xyz"})
+async def test_dispatcher_entry_location_not_found() -> None:
+    handler = _tool_with(_mock_response({"results": []})).as_dispatcher_entry()
+    raw = await handler({"location": "nonexistent place xyz"})
 
-    data = json.loads(raw)
+    data = _loads(raw)
     assert "error" in data
 
 
 @pytest.mark.anyio
-async def test_dispatcher_entry_http_error_returns_json_error():
-    tool = WeatherTool()
-    geo_resp = _mock_error_response(503)
-    async_client_cls, _ = _make_client_mock(geo_resp)
-
-    handler = tool.as_dispatcher_entry()
-    with patch("chatterbox.conversation.tools.weather.httpx.AsyncClient", async_client_cls):
-        raw = await handler({"location": "Kansas City"})
+async def test_dispatcher_entry_http_error_returns_json_error() -> None:
+    handler = _tool_with(_mock_error_response(503)).as_dispatcher_entry()
+    raw = await handler({"location": "Kansas City"})
 
-    data = json.loads(raw)
+    data = _loads(raw)
     assert "error" in data
     assert "503" in data["error"]
 
 
 @pytest.mark.anyio
-async def test_dispatcher_entry_timeout_returns_json_error():
-    tool = WeatherTool()
-
-    client_instance = AsyncMock()
-    client_instance.get = AsyncMock(side_effect=httpx.TimeoutException("timeout"))
-    ctx_manager = MagicMock()
-    ctx_manager.__aenter__ = AsyncMock(return_value=client_instance)
-    ctx_manager.__aexit__ = AsyncMock(return_value=False)
-    async_client_cls = MagicMock(return_value=ctx_manager)
-
-    handler = tool.as_dispatcher_entry()
-    with patch("chatterbox.conversation.tools.weather.httpx.AsyncClient", async_client_cls):
-        raw = await handler({"location": "Kansas City"})
+async def test_dispatcher_entry_timeout_returns_json_error() -> None:
+    handler = _tool_with(httpx.TimeoutException("timeout")).as_dispatcher_entry()
+    raw = await handler({"location": "Kansas City"})
 
-    data = json.loads(raw)
+    data = _loads(raw)
     assert "error" in data
     assert "timed out" in data["error"].lower()
 
@@ -388,9 +359,12 @@ class TestWmoConditions:
         assert _WMO_CONDITIONS[99] == "Thunderstorm with heavy hail"
 
     def test_all_codes_are_strings(self):
-        for code, description in _WMO_CONDITIONS.items():
-            assert isinstance(description, str), f"WMO code {code} has non-string description"
-            assert description, f"WMO code {code} has empty description"
+        bad = [
+            code
+            for code, description in _WMO_CONDITIONS.items()
+            if not isinstance(description, str) or not description
+        ]
+        assert not bad, f"WMO codes with missing/non-string descriptions: {bad}"
 
 
 # ---------------------------------------------------------------------------
@@ -399,9 +373,8 @@ class TestWmoConditions:
 
 
 @pytest.mark.anyio
-async def test_location_name_without_admin():
+async def test_location_name_without_admin() -> None:
     """Geocoder may omit admin1 for some locations."""
-    tool = WeatherTool()
     geo_data = {
         "results": [
             {
@@ -413,12 +386,8 @@ async def test_location_name_without_admin():
             }
         ]
     }
-    geo_resp = _mock_response(geo_data)
-    wx_resp = _mock_response(_weather_response())
-    async_client_cls, _ = _make_client_mock(geo_resp, wx_resp)
-
-    with patch("chatterbox.conversation.tools.weather.httpx.AsyncClient", async_client_cls):
-        result = await tool.get_weather("London")
+    tool = _tool_with(_mock_response(geo_data), _mock_response(_DEFAULT_WX))
+    result = await tool.get_weather("London")
 
     assert "London" in result["location_name"]
     assert "United Kingdom" in result["location_name"]
@@ -426,16 +395,3 @@ async def test_location_name_without_admin():
     assert not result["location_name"].startswith(",")
     assert not result["location_name"].endswith(",")
 
-
-@pytest.mark.anyio
-async def test_humidity_cast_to_int():
-    tool = WeatherTool()
-    geo_resp = _mock_response(_geo_response())
-    wx_resp = _mock_response(_weather_response(humidity=72))
-    async_client_cls, _ = _make_client_mock(geo_resp, wx_resp)
-
-    with patch("chatterbox.conversation.tools.weather.httpx.AsyncClient", async_client_cls):
-        result = await tool.get_weather("Somewhere")
-
-    assert isinstance(result["humidity_percent"], int)
-    assert result["humidity_percent"] == 72
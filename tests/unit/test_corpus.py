@@ -1,27 +1,37 @@
 """Unit tests for ha_emulator.corpus."""
 
+import io
 import json
 import wave
-import struct
+from functools import lru_cache
 from pathlib import Path
 
 import pytest
 
-from ha_emulator.corpus import CorpusEntry, CorpusLoader
+from ha_emulator.corpus import CorpusLoader
 
 
-def _make_wav(path: Path, duration_frames: int = 160) -> None:
-    """Write a minimal valid WAV file."""
-    with wave.open(str(path), "wb") as wf:
+@lru_cache(maxsize=None)
+def _wav_bytes(duration_frames: int = 160) -> bytes:
+    """Assemble a minimal valid WAV blob once per duration."""
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as wf:
         wf.setnchannels(1)
         wf.setsampwidth(2)
         wf.setframerate(16000)
         wf.writeframes(b"\x00\x00" * duration_frames)
+    return buf.getvalue()
+
+
+def _make_wav(path: Path, duration_frames: int = 160) -> None:
+    """Write a minimal valid WAV file."""
+    path.write_bytes(_wav_bytes(duration_frames))
 
 
-@pytest.fixture()
-def corpus_dir(tmp_path):
-    """Minimal corpus with two entries."""
+@pytest.fixture(scope="class")
+def corpus_dir(tmp_path_factory):
+    """Minimal corpus with two entries, built once per test class (read-only)."""
+    tmp_path = tmp_path_factory.mktemp("corpus")
     wav1 = tmp_path / "test_001_lights.wav"
     wav2 = tmp_path / "test_002_weather.wav"
     _make_wav(wav1)
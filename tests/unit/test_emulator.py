@@ -1,14 +1,16 @@
 """Unit tests for ha_emulator.emulator (mocked Wyoming server)."""
 
 import asyncio
+import io
 import json
 import wave
+from functools import lru_cache
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from ha_emulator.emulator import HAEmulator, STTResult, TTSResult, FullResult, _read_wav
+from ha_emulator.emulator import HAEmulator, FullResult, _read_wav
 
 
 # ---------------------------------------------------------------------------
@@ -16,12 +18,20 @@ from ha_emulator.emulator import HAEmulator, STTResult, TTSResult, FullResult, _
 # ---------------------------------------------------------------------------
 
 
-def _make_wav(path: Path, duration_frames: int = 160) -> None:
-    with wave.open(str(path), "wb") as wf:
+@lru_cache(maxsize=None)
+def _wav_bytes(duration_frames: int = 160) -> bytes:
+    """Assemble a minimal valid WAV blob once per duration (as in test_corpus)."""
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as wf:
         wf.setnchannels(1)
         wf.setsampwidth(2)
         wf.setframerate(16000)
         wf.writeframes(b"\x00\x00" * duration_frames)
+    return buf.getvalue()
+
+
+def _make_wav(path: Path, duration_frames: int = 160) -> None:
+    path.write_bytes(_wav_bytes(duration_frames))
 
 
 def _make_event_bytes(event_type: str, data: dict = None, payload: bytes = None) -> bytes:
@@ -30,17 +40,42 @@ def _make_event_bytes(event_type: str, data: dict = None, payload: bytes = None)
     Header JSON: {"type": ..., "version": "1.8.0", ["data_length": N], ["payload_length": M]}
     Followed by data_bytes (JSON) then payload bytes.
     """
-    header: dict = {"type": event_type, "version": "1.8.0"}
     data_bytes = b""
+    lengths = b""
     if data:
         data_bytes = json.dumps(data, ensure_ascii=False).encode("utf-8")
-        header["data_length"] = len(data_bytes)
+        lengths += b',"data_length":%d' % len(data_bytes)
     if payload:
-        header["payload_length"] = len(payload)
-    line = json.dumps(header).encode("utf-8") + b"\n"
+        lengths += b',"payload_length":%d' % len(payload)
+    # Header fields are ASCII-safe, so byte formatting skips json.dumps's
+    # escape scanning while producing equivalent JSON.
+    line = b'{"type":"%s","version":"1.8.0"%s}\n' % (event_type.encode(), lengths)
     return line + data_bytes + (payload or b"")
 
 
+# Canonical events and full server responses reused across tests,
+# serialised once at import.
+_AUDIO_START_22050 = _make_event_bytes(
+    "audio-start", {"rate": 22050, "width": 2, "channels": 1}
+)
+_AUDIO_STOP = _make_event_bytes("audio-stop")
+_STT_RESPONSE = _make_event_bytes("transcript", {"text": "turn on the lights"})
+_TTS_AUDIO = b"\x01\x02" * 200
+_TTS_RESPONSE = (
+    _AUDIO_START_22050
+    + _make_event_bytes(
+        "audio-chunk", {"rate": 22050, "width": 2, "channels": 1}, payload=_TTS_AUDIO
+    )
+    + _AUDIO_STOP
+)
+# Server responses per scenario, one entry per connection the emulator opens.
+_SCENARIO_RESPONSES = {
+    "stt": [_STT_RESPONSE],
+    "tts": [_TTS_RESPONSE],
+    "full": [_STT_RESPONSE, _TTS_RESPONSE],
+}
+
+
 class FakeStreamReader:
     """Delivers pre-built byte sequences via async_read_event calls."""
 
@@ -70,36 +105,52 @@ def test_read_wav(tmp_path):
 
 
 # ---------------------------------------------------------------------------
-# HAEmulator.run_stt — happy path
+# HAEmulator.run_stt / run_tts / run_full — happy paths
 # ---------------------------------------------------------------------------
 
 
 @pytest.mark.asyncio
-async def test_run_stt_success(tmp_path):
-    wav = tmp_path / "audio.wav"
-    _make_wav(wav)
+@pytest.mark.parametrize("scenario", ["stt", "tts", "full"])
+async def test_run_success(scenario, tmp_path):
+    """One patched connection factory serves every success scenario.
 
-    # Build a fake server response: just a transcript event
-    server_response = _make_event_bytes(
-        "transcript", {"text": "turn on the lights"}
-    )
+    The scenarios share identical wiring and differ only in which
+    pre-serialised server responses arrive and which run_* entry point
+    is exercised, so they are branches of one parametrized test.
+    """
+    responses = iter(_SCENARIO_RESPONSES[scenario])
 
-    reader = FakeStreamReader(server_response)
-    writer = MagicMock()
-    writer.close = MagicMock()
-    writer.wait_closed = AsyncMock()
-    writer.drain = AsyncMock()
+    async def fake_open(host, port):
+        writer = MagicMock()
+        writer.close = MagicMock()
+        writer.wait_closed = AsyncMock()
+        writer.drain = AsyncMock()
+        return FakeStreamReader(next(responses)), writer
 
-    with patch(
-        "ha_emulator.emulator.asyncio.open_connection",
-        new=AsyncMock(return_value=(reader, writer)),
-    ):
-        emulator = HAEmulator("localhost", 10700, timeout=5.0)
-        result = await emulator.run_stt(wav)
+    wav = tmp_path / "audio.wav"
+    if scenario != "tts":
+        _make_wav(wav)
 
-    assert result.success is True
-    assert result.transcript == "turn on the lights"
-    assert result.error is None
+    with patch("ha_emulator.emulator.asyncio.open_connection", new=fake_open):
+        emulator = HAEmulator("localhost", 10700, timeout=5.0)
+        if scenario == "stt":
+            result = await emulator.run_stt(wav)
+            assert result.success is True
+            assert result.transcript == "turn on the lights"
+            assert result.error is None
+        elif scenario == "tts":
+            result = await emulator.run_tts("hello world")
+            assert result.success is True
+            assert result.audio_rate == 22050
+            assert result.audio_width == 2
+            assert result.audio_channels == 1
+            assert len(result.audio_bytes) > 0
+        else:
+            result = await emulator.run_full(wav)
+            assert isinstance(result, FullResult)
+            assert result.stt.transcript == "turn on the lights"
+            assert result.tts.success is True
+            assert result.round_trip_ms >= 0
 
 
 # ---------------------------------------------------------------------------
@@ -123,41 +174,6 @@ async def test_run_stt_connection_refused(tmp_path):
     assert "Connection failed" in result.error
 
 
-# ---------------------------------------------------------------------------
-# HAEmulator.run_tts — happy path
-# ---------------------------------------------------------------------------
-
-
-@pytest.mark.asyncio
-async def test_run_tts_success():
-    audio_payload = b"\x01\x02" * 200
-
-    server_response = (
-        _make_event_bytes("audio-start", {"rate": 22050, "width": 2, "channels": 1})
-        + _make_event_bytes("audio-chunk", {"rate": 22050, "width": 2, "channels": 1}, payload=audio_payload)
-        + _make_event_bytes("audio-stop")
-    )
-
-    reader = FakeStreamReader(server_response)
-    writer = MagicMock()
-    writer.close = MagicMock()
-    writer.wait_closed = AsyncMock()
-    writer.drain = AsyncMock()
-
-    with patch(
-        "ha_emulator.emulator.asyncio.open_connection",
-        new=AsyncMock(return_value=(reader, writer)),
-    ):
-        emulator = HAEmulator("localhost", 10700, timeout=5.0)
-        result = await emulator.run_tts("hello world")
-
-    assert result.success is True
-    assert result.audio_rate == 22050
-    assert result.audio_width == 2
-    assert result.audio_channels == 1
-    assert len(result.audio_bytes) > 0
-
-
 # ---------------------------------------------------------------------------
 # HAEmulator.run_tts — connection failure
 # ---------------------------------------------------------------------------
@@ -174,44 +190,3 @@ async def test_run_tts_connection_refused():
 
     assert result.success is False
     assert result.audio_bytes == b""
-
-
-# ---------------------------------------------------------------------------
-# HAEmulator.run_full — wires stt + tts
-# ---------------------------------------------------------------------------
-
-
-@pytest.mark.asyncio
-async def test_run_full_composes_stt_and_tts(tmp_path):
-    wav = tmp_path / "audio.wav"
-    _make_wav(wav)
-
-    stt_response = _make_event_bytes("transcript", {"text": "lights on"})
-    tts_audio = b"\xff" * 320
-    tts_response = (
-        _make_event_bytes("audio-start", {"rate": 22050, "width": 2, "channels": 1})
-        + _make_event_bytes("audio-chunk", {}, payload=tts_audio)
-        + _make_event_bytes("audio-stop")
-    )
-
-    call_count = 0
-
-    async def fake_open(host, port):
-        nonlocal call_count
-        call_count += 1
-        writer = MagicMock()
-        writer.close = MagicMock()
-        writer.wait_closed = AsyncMock()
-        writer.drain = AsyncMock()
-        if call_count == 1:
-            return FakeStreamReader(stt_response), writer
-        return FakeStreamReader(tts_response), writer
-
-    with patch("ha_emulator.emulator.asyncio.open_connection", new=fake_open):
-        emulator = HAEmulator("localhost", 10700, timeout=5.0)
-        result = await emulator.run_full(wav)
-
-    assert isinstance(result, FullResult)
-    assert result.stt.transcript == "lights on"
-    assert result.tts.success is True
-    assert result.round_trip_ms >= 0
@@ -1,5 +1,6 @@
 """Unit tests for ha_emulator.runner."""
 
+import io
 import json
 import wave
 from pathlib import Path
@@ -18,12 +19,22 @@ from ha_emulator.validator import ResultValidator
 # ---------------------------------------------------------------------------
 
 
-def _make_wav(path: Path) -> None:
-    with wave.open(str(path), "wb") as wf:
+def _build_wav_bytes() -> bytes:
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as wf:
         wf.setnchannels(1)
         wf.setsampwidth(2)
         wf.setframerate(16000)
         wf.writeframes(b"\x00\x00" * 160)
+    return buf.getvalue()
+
+
+# All test WAVs share identical content; assemble the blob once.
+_WAV_BYTES = _build_wav_bytes()
+
+
+def _make_wav(path: Path) -> None:
+    path.write_bytes(_WAV_BYTES)
 
 
 def _corpus_with_entries(tmp_path, entries):